@@ -62,6 +62,18 @@ class Trade:
         return self.exit_timestamp - self.timestamp
 
 
+_TRADE_COLUMNS = (
+    'timestamp', 'symbol', 'side', 'direction', 'quantity', 'entry_price',
+    'exit_price', 'exit_timestamp', 'commission', 'slippage'
+)
+_REQUIRED_TRADE_COLUMNS = frozenset({'timestamp', 'symbol', 'side', 'quantity', 'entry_price'})
+
+
+def _encode_direction(sides) -> np.ndarray:
+    """Encode sides as int8: BUY -> 1, anything else (SELL) -> -1."""
+    return np.where(np.asarray(sides) == 'BUY', 1, -1).astype(np.int8)
+
+
 class AttributionAnalyzer:
     """
     Analyze P&L attribution across different dimensions.
@@ -72,16 +84,139 @@ class AttributionAnalyzer:
     - Strategy
     - Long vs short
     - Cost components (commission, slippage)
+    
+    Trades are analyzed as column arrays (one array per field) so P&L
+    is computed in a single vectorized pass rather than per Trade object.
     """
     
     def __init__(self):
         """Initialize analyzer."""
         self.trades: List[Trade] = []
+        self._bulk_trades: List[pd.DataFrame] = []
+        self._bulk_cache: Optional[pd.DataFrame] = None
+        self._bulk_count = 0
     
     def add_trade(self, trade: Trade):
         """Add trade to analysis."""
         self.trades.append(trade)
-        logger.debug(f"Added trade: {trade.symbol} {trade.side} @ {trade.entry_price}")
+        logger.debug("Added trade: %s %s @ %s", trade.symbol, trade.side, trade.entry_price)
+    
+    def add_trades_bulk(self, trades: pd.DataFrame):
+        """
+        Add many trades at once.
+        
+        Columns mirror the Trade fields. exit_price, exit_timestamp,
+        commission and slippage are optional; rows without an exit price
+        are treated as open.
+        
+        Args:
+            trades: DataFrame with one row per trade
+        """
+        missing = _REQUIRED_TRADE_COLUMNS.difference(trades.columns)
+        if missing:
+            raise ValueError(f"Missing trade columns: {sorted(missing)}")
+        
+        n = len(trades)
+        columns = {
+            'timestamp': pd.to_datetime(trades['timestamp']).to_numpy(),
+            'symbol': trades['symbol'].to_numpy(),
+            'side': trades['side'].to_numpy(),
+            'direction': _encode_direction(trades['side'].to_numpy()),
+            'quantity': trades['quantity'].to_numpy(dtype=np.float64),
+            'entry_price': trades['entry_price'].to_numpy(dtype=np.float64),
+            'exit_price': (
+                trades['exit_price'].to_numpy(dtype=np.float64)
+                if 'exit_price' in trades else np.full(n, np.nan)
+            ),
+            'exit_timestamp': (
+                pd.to_datetime(trades['exit_timestamp']).to_numpy()
+                if 'exit_timestamp' in trades else np.full(n, np.datetime64('NaT', 'ns'))
+            ),
+            'commission': (
+                trades['commission'].to_numpy(dtype=np.float64)
+                if 'commission' in trades else np.zeros(n)
+            ),
+            'slippage': (
+                trades['slippage'].to_numpy(dtype=np.float64)
+                if 'slippage' in trades else np.zeros(n)
+            ),
+        }
+        self._bulk_trades.append(pd.DataFrame(columns))
+        logger.debug("Added %d trades in bulk", n)
+    
+    def _bulk_frame(self) -> Optional[pd.DataFrame]:
+        """
+        Bulk-added trades as one frame.
+        
+        Bulk rows are owned by the analyzer and never edited, so the
+        concatenation is only redone when more batches arrive.
+        """
+        if self._bulk_count != len(self._bulk_trades):
+            self._bulk_cache = pd.concat(self._bulk_trades, ignore_index=True)
+            self._bulk_count = len(self._bulk_trades)
+        return self._bulk_cache
+    
+    def _trade_frame(self) -> pd.DataFrame:
+        """
+        All trades as a column-oriented frame with vectorized P&L.
+        
+        Trade objects are mutable (e.g. closed after add_trade), so their
+        rows are re-read on every call.
+        """
+        frames = [self._bulk_frame()] if self._bulk_trades else []
+        if self.trades:
+            frames.insert(0, pd.DataFrame({
+                'timestamp': pd.to_datetime([t.timestamp for t in self.trades]),
+                'symbol': [t.symbol for t in self.trades],
+                'side': [t.side for t in self.trades],
+                'direction': _encode_direction([t.side for t in self.trades]),
+                'quantity': np.array([t.quantity for t in self.trades], dtype=np.float64),
+                'entry_price': np.array([t.entry_price for t in self.trades], dtype=np.float64),
+                'exit_price': np.array([t.exit_price for t in self.trades], dtype=np.float64),
+                'exit_timestamp': pd.to_datetime([t.exit_timestamp for t in self.trades]),
+                'commission': np.array([t.commission for t in self.trades], dtype=np.float64),
+                'slippage': np.array([t.slippage for t in self.trades], dtype=np.float64),
+            }))
+        
+        if not frames:
+            frame = pd.DataFrame(columns=list(_TRADE_COLUMNS) + ['is_closed', 'pnl', 'return_pct'])
+        else:
+            frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].copy()
+            
+            quantity = frame['quantity'].to_numpy()
+            entry = frame['entry_price'].to_numpy()
+            is_closed = ~np.isnan(frame['exit_price'].to_numpy())
+            
+            pnl = self._pnl_vectorized(frame)
+            np.copyto(pnl, 0.0, where=~is_closed)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return_pct = np.where(is_closed & (entry != 0), pnl / (quantity * entry), 0.0)
+            
+            frame['is_closed'] = is_closed
+            frame['pnl'] = pnl
+            frame['return_pct'] = return_pct
+        
+        return frame
+    
+    @staticmethod
+    def _pnl_vectorized(frame: pd.DataFrame) -> np.ndarray:
+        """
+        Net P&L for every trade in one branchless pass.
+        
+        ``direction * quantity * (exit - entry) - commission - slippage``,
+        accumulated in a single output buffer. Open trades yield NaN.
+        """
+        pnl = np.subtract(frame['exit_price'].to_numpy(), frame['entry_price'].to_numpy())
+        np.multiply(pnl, frame['quantity'].to_numpy(), out=pnl)
+        np.multiply(pnl, frame['direction'].to_numpy(), out=pnl)
+        np.subtract(pnl, frame['commission'].to_numpy(), out=pnl)
+        np.subtract(pnl, frame['slippage'].to_numpy(), out=pnl)
+        return pnl
+    
+    def _closed_frame(self) -> pd.DataFrame:
+        """Closed trades only."""
+        frame = self._trade_frame()
+        return frame[frame['is_closed'].to_numpy(dtype=bool)]
     
     def analyze_by_time(self, frequency: str = 'D') -> pd.DataFrame:
         """
@@ -93,24 +228,13 @@ class AttributionAnalyzer:
         Returns:
             DataFrame with P&L by period
         """
-        if not self.trades:
+        closed = self._closed_frame()
+        if closed.empty:
             return pd.DataFrame()
         
-        closed_trades = [t for t in self.trades if t.is_closed]
-        if not closed_trades:
-            return pd.DataFrame()
-        
-        # Create DataFrame
-        df = pd.DataFrame([
-            {
-                'timestamp': t.exit_timestamp,
-                'pnl': t.pnl,
-                'return_pct': t.return_pct,
-                'commission': t.commission,
-                'slippage': t.slippage
-            }
-            for t in closed_trades
-        ])
+        df = closed[['exit_timestamp', 'pnl', 'return_pct', 'commission', 'slippage']].rename(
+            columns={'exit_timestamp': 'timestamp'}
+        )
         
         # Group by period
         df.set_index('timestamp', inplace=True)
@@ -144,43 +268,22 @@ class AttributionAnalyzer:
         Returns:
             DataFrame with P&L by symbol
         """
-        closed_trades = [t for t in self.trades if t.is_closed]
-        if not closed_trades:
+        closed = self._closed_frame()
+        if closed.empty:
             return pd.DataFrame()
         
-        # Group by symbol
-        symbol_data = {}
-        for trade in closed_trades:
-            if trade.symbol not in symbol_data:
-                symbol_data[trade.symbol] = {
-                    'pnl': [],
-                    'return_pct': [],
-                    'num_trades': 0,
-                    'commission': 0,
-                    'slippage': 0
-                }
-            
-            symbol_data[trade.symbol]['pnl'].append(trade.pnl)
-            symbol_data[trade.symbol]['return_pct'].append(trade.return_pct)
-            symbol_data[trade.symbol]['num_trades'] += 1
-            symbol_data[trade.symbol]['commission'] += trade.commission
-            symbol_data[trade.symbol]['slippage'] += trade.slippage
-        
-        # Create DataFrame
-        rows = []
-        for symbol, data in symbol_data.items():
-            rows.append({
-                'symbol': symbol,
-                'total_pnl': sum(data['pnl']),
-                'avg_pnl': np.mean(data['pnl']),
-                'avg_return_pct': np.mean(data['return_pct']),
-                'num_trades': data['num_trades'],
-                'win_rate': sum(1 for p in data['pnl'] if p > 0) / len(data['pnl']),
-                'total_commission': data['commission'],
-                'total_slippage': data['slippage']
-            })
-        
-        df = pd.DataFrame(rows)
+        df = closed.assign(is_winner=closed['pnl'].to_numpy() > 0).groupby(
+            'symbol', sort=False
+        ).agg(
+            total_pnl=('pnl', 'sum'),
+            avg_pnl=('pnl', 'mean'),
+            avg_return_pct=('return_pct', 'mean'),
+            num_trades=('pnl', 'size'),
+            win_rate=('is_winner', 'mean'),
+            total_commission=('commission', 'sum'),
+            total_slippage=('slippage', 'sum'),
+        ).reset_index()
+        
         df.sort_values('total_pnl', ascending=False, inplace=True)
         return df
     
@@ -191,13 +294,12 @@ class AttributionAnalyzer:
         Returns:
             Dictionary with stats for longs and shorts
         """
-        closed_trades = [t for t in self.trades if t.is_closed]
-        
-        longs = [t for t in closed_trades if t.side == 'BUY']
-        shorts = [t for t in closed_trades if t.side == 'SELL']
+        closed = self._closed_frame()
+        pnl = closed['pnl'].to_numpy(dtype=np.float64)
+        is_long = closed['direction'].to_numpy() > 0
         
-        def calc_stats(trades):
-            if not trades:
+        def calc_stats(pnls):
+            if len(pnls) == 0:
                 return {
                     'num_trades': 0,
                     'total_pnl': 0,
@@ -207,23 +309,22 @@ class AttributionAnalyzer:
                     'avg_loser': 0
                 }
             
-            pnls = [t.pnl for t in trades]
-            winners = [p for p in pnls if p > 0]
-            losers = [p for p in pnls if p < 0]
+            winners = pnls[pnls > 0]
+            losers = pnls[pnls < 0]
             
             return {
-                'num_trades': len(trades),
-                'total_pnl': sum(pnls),
-                'avg_pnl': np.mean(pnls),
-                'win_rate': len(winners) / len(pnls) if pnls else 0,
-                'avg_winner': np.mean(winners) if winners else 0,
-                'avg_loser': np.mean(losers) if losers else 0
+                'num_trades': len(pnls),
+                'total_pnl': float(pnls.sum()),
+                'avg_pnl': float(pnls.mean()),
+                'win_rate': len(winners) / len(pnls),
+                'avg_winner': float(winners.mean()) if len(winners) else 0,
+                'avg_loser': float(losers.mean()) if len(losers) else 0
             }
         
         return {
-            'long': calc_stats(longs),
-            'short': calc_stats(shorts),
-            'total': calc_stats(closed_trades)
+            'long': calc_stats(pnl[is_long]),
+            'short': calc_stats(pnl[~is_long]),
+            'total': calc_stats(pnl)
         }
     
     def analyze_costs(self) -> Dict:
@@ -233,9 +334,9 @@ class AttributionAnalyzer:
         Returns:
             Dictionary with cost analysis
         """
-        closed_trades = [t for t in self.trades if t.is_closed]
+        closed = self._closed_frame()
         
-        if not closed_trades:
+        if closed.empty:
             return {
                 'total_commission': 0,
                 'total_slippage': 0,
@@ -245,13 +346,13 @@ class AttributionAnalyzer:
                 'cost_ratio': 0
             }
         
-        total_commission = sum(t.commission for t in closed_trades)
-        total_slippage = sum(t.slippage for t in closed_trades)
+        total_commission = float(closed['commission'].sum())
+        total_slippage = float(closed['slippage'].sum())
         total_costs = total_commission + total_slippage
         
-        # Calculate gross P&L (before costs)
-        gross_pnl = sum(t.pnl + t.commission + t.slippage for t in closed_trades)
-        net_pnl = sum(t.pnl for t in closed_trades)
+        # Gross P&L adds the costs back onto net P&L
+        net_pnl = float(closed['pnl'].sum())
+        gross_pnl = net_pnl + total_costs
         
         return {
             'total_commission': total_commission,
@@ -271,9 +372,10 @@ class AttributionAnalyzer:
         Returns:
             Dictionary with full attribution breakdown
         """
-        closed_trades = [t for t in self.trades if t.is_closed]
+        frame = self._trade_frame()
+        closed = self._closed_frame()
         
-        if not closed_trades:
+        if closed.empty:
             logger.warning("No closed trades to analyze")
             return {
                 'num_trades': 0,
@@ -284,10 +386,10 @@ class AttributionAnalyzer:
             }
         
         summary = {
-            'num_trades': len(closed_trades),
-            'num_open': len(self.trades) - len(closed_trades),
-            'total_pnl': sum(t.pnl for t in closed_trades),
-            'avg_pnl_per_trade': np.mean([t.pnl for t in closed_trades]),
+            'num_trades': len(closed),
+            'num_open': len(frame) - len(closed),
+            'total_pnl': float(closed['pnl'].sum()),
+            'avg_pnl_per_trade': float(closed['pnl'].mean()),
             'by_direction': self.analyze_by_direction(),
             'by_costs': self.analyze_costs(),
         }
@@ -45,6 +45,7 @@ class Backtester:
 
     def _build_positions(self,
                          data: pd.DataFrame,
+                         volatility: pd.Series,
                          position_sizer=None,
                          sizing_params: Optional[Dict] = None) -> pd.Series:
         """Build equity-relative position fractions with optional dynamic sizing."""
@@ -54,56 +55,47 @@ class Backtester:
         sizing_params = sizing_params or {}
         equity = self.initial_capital
         equity_peak = self.initial_capital
-        positions = []
+        positions = np.empty(len(data), dtype=np.float64)
 
-        returns = data['close'].pct_change(1).fillna(0.0)
-        fallback_vol = self._resolve_volatility(data)
+        signals = data['signal'].to_numpy()
+        returns = data['market_return'].to_numpy(dtype=np.float64)
+        fallback_vol = volatility.to_numpy(dtype=np.float64)
 
-        for idx, row in data.iterrows():
+        for i in range(len(data)):
             drawdown = 0.0 if equity_peak <= 0 else (equity_peak - equity) / equity_peak
 
             params = dict(sizing_params)
             if params.get('method') == 'volatility_based' and 'volatility' not in params:
-                params['volatility'] = float(fallback_vol.loc[idx])
+                params['volatility'] = float(fallback_vol[i])
 
             position_size = position_sizer.calculate_position(
-                signal=int(row['signal']),
+                signal=int(signals[i]),
                 equity=equity,
                 current_drawdown=drawdown,
                 **params
             )
-            position_fraction = np.sign(row['signal']) * (position_size / equity if equity > 0 else 0.0)
-            positions.append(position_fraction)
+            position_fraction = np.sign(signals[i]) * (position_size / equity if equity > 0 else 0.0)
+            positions[i] = position_fraction
 
-            bar_ret = returns.loc[idx]
+            bar_ret = returns[i]
             equity = equity * (1 + (position_fraction * bar_ret))
             equity_peak = max(equity_peak, equity)
 
         return pd.Series(positions, index=data.index, dtype=float)
 
-    def _apply_execution_model(self, data: pd.DataFrame) -> pd.Series:
+    def _apply_execution_model(self, data: pd.DataFrame, volatility: pd.Series) -> pd.Series:
         """Convert target position to realized position with partial fills."""
-        order_types = data['order_type'] if 'order_type' in data.columns else pd.Series('market', index=data.index)
+        order_types = data['order_type'] if 'order_type' in data.columns else pd.Series('market', index=data.index, dtype='category')
         book_depth = data['book_depth'] if 'book_depth' in data.columns else pd.Series(1.0, index=data.index)
-        volatility = self._resolve_volatility(data)
-
-        realized = []
-        current_pos = 0.0
-        for idx in data.index:
-            target_pos = float(data.loc[idx, 'position'])
-            delta = target_pos - current_pos
-            fill = self.execution_model.simulate_fill(
-                order_size=abs(delta),
-                order_type=str(order_types.loc[idx]),
-                book_depth=float(book_depth.loc[idx]),
-                volatility=float(volatility.loc[idx]),
-            )
-            current_pos = current_pos + np.sign(delta) * abs(delta) * fill.fill_ratio
-            realized.append((current_pos, fill.fee_multiplier))
 
-        realized_pos = pd.Series([r[0] for r in realized], index=data.index, dtype=float)
-        data['fee_multiplier'] = pd.Series([r[1] for r in realized], index=data.index, dtype=float)
-        return realized_pos
+        realized_pos, fee_multiplier = self.execution_model.simulate_path(
+            data['position'].to_numpy(dtype=np.float64),
+            order_types.array,
+            book_depth.to_numpy(dtype=np.float64),
+            volatility.to_numpy(dtype=np.float64),
+        )
+        data['fee_multiplier'] = pd.Series(fee_multiplier, index=data.index, dtype=float)
+        return pd.Series(realized_pos, index=data.index, dtype=float)
 
     def run(self, strategy, data: pd.DataFrame, position_sizer=None, sizing_params: Optional[Dict] = None) -> tuple:
         """Run backtest on strategy."""
@@ -114,9 +106,11 @@ class Backtester:
         if 'signal' not in data.columns:
             raise ValueError("Strategy did not generate 'signal' column")
 
+        # Derived once per run and shared by sizing and the execution model
         data['market_return'] = data['close'].pct_change(1).fillna(0.0)
-        data['position'] = self._build_positions(data, position_sizer=position_sizer, sizing_params=sizing_params)
-        data['realized_position'] = self._apply_execution_model(data)
+        volatility = self._resolve_volatility(data)
+        data['position'] = self._build_positions(data, volatility, position_sizer=position_sizer, sizing_params=sizing_params)
+        data['realized_position'] = self._apply_execution_model(data, volatility)
 
         data['position_lagged'] = data['realized_position'].shift(1).fillna(0.0)
         data['strategy_return'] = data['position_lagged'] * data['market_return']
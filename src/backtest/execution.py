@@ -1,8 +1,11 @@
 """Execution model abstractions for backtesting."""
 
 from dataclasses import dataclass
+from typing import Tuple
 import numpy as np
 
+from src.utils._njit import njit
+
 
 @dataclass
 class FillResult:
@@ -10,6 +13,42 @@ class FillResult:
     fee_multiplier: float
 
 
+@njit(cache=True)
+def _simulate_path(target, is_market, book_depth, volatility, limit_fill_sensitivity):
+    """Compiled twin of ExecutionModel.simulate_fill walked over a target path."""
+    n = target.shape[0]
+    realized = np.empty(n, dtype=np.float64)
+    fee_multiplier = np.empty(n, dtype=np.float64)
+    current_pos = 0.0
+    for i in range(n):
+        delta = target[i] - current_pos
+        abs_size = abs(delta)
+        # Comparisons mirror the builtin min/max argument order in simulate_fill
+        if abs_size <= 0:
+            fill_ratio = 0.0
+            fee = 1.0
+        elif is_market[i]:
+            impact = volatility[i] * 20.0
+            fill_ratio = 1.0
+            fee = 1.0 + (impact if impact < 2.0 else 2.0)
+        else:
+            depth_factor = book_depth[i] / (1e-9 if 1e-9 > abs_size else abs_size)
+            if depth_factor < 1.0:
+                fill_ratio = depth_factor
+            else:
+                fill_ratio = 1.0
+            fill_ratio *= np.exp(-limit_fill_sensitivity * (volatility[i] if volatility[i] > 0.0 else 0.0))
+            if fill_ratio < 0.0:
+                fill_ratio = 0.0
+            elif fill_ratio > 1.0:
+                fill_ratio = 1.0
+            fee = 0.7
+        current_pos = current_pos + np.sign(delta) * abs_size * fill_ratio
+        realized[i] = current_pos
+        fee_multiplier[i] = fee
+    return realized, fee_multiplier
+
+
 class ExecutionModel:
     """Simple execution model supporting market/limit orders and partial fills."""
 
@@ -39,3 +78,37 @@ class ExecutionModel:
         # Better fees when passive (limit), but partial fill risk.
         fee_multiplier = 0.7
         return FillResult(fill_ratio=fill_ratio, fee_multiplier=fee_multiplier)
+
+    def simulate_path(
+        self,
+        target: np.ndarray,
+        order_types: np.ndarray,
+        book_depth: np.ndarray,
+        volatility: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fill a target position path bar by bar; returns (realized, fee_multiplier).
+
+        ``order_types`` may be an object array or a pandas Categorical; the
+        latter compares on its integer codes.
+        """
+        if type(self).simulate_fill is ExecutionModel.simulate_fill:
+            is_market = np.asarray(order_types == 'market', dtype=np.bool_)
+            return _simulate_path(target, is_market, book_depth, volatility,
+                                  float(self.limit_fill_sensitivity))
+
+        # Subclass fill logic is not compiled; call it per bar
+        realized = np.empty(len(target))
+        fee_multiplier = np.empty(len(target))
+        current_pos = 0.0
+        for i in range(len(target)):
+            delta = target[i] - current_pos
+            fill = self.simulate_fill(
+                order_size=abs(delta),
+                order_type=str(order_types[i]),
+                book_depth=book_depth[i],
+                volatility=volatility[i],
+            )
+            current_pos = current_pos + np.sign(delta) * abs(delta) * fill.fill_ratio
+            realized[i] = current_pos
+            fee_multiplier[i] = fill.fee_multiplier
+        return realized, fee_multiplier
@@ -1,17 +1,78 @@
 """Walk-forward validation utilities."""
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Tuple, Optional, Callable
 import copy
+import multiprocessing
+import os
 import pandas as pd
 
 
+def _pool_context():
+    """Start workers from a clean process rather than forking this one.
+
+    Forking after Numba's parallel threading layer has started can leave
+    the parent hung at interpreter exit.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _run_fold(
+    backtester,
+    strategy,
+    train: pd.DataFrame,
+    test: pd.DataFrame,
+    position_sizer=None,
+    sizing_params=None,
+    calibrator: Optional[Callable] = None,
+) -> Dict:
+    """Calibrate a private strategy copy on train, backtest it on test."""
+    strategy_fold = copy.deepcopy(strategy)
+    if calibrator is not None:
+        calibrator(strategy_fold, train)
+    elif hasattr(strategy_fold, 'fit') and callable(getattr(strategy_fold, 'fit')):
+        strategy_fold.fit(train)
+
+    results, metrics = backtester.run(
+        strategy_fold,
+        test,
+        position_sizer=position_sizer,
+        sizing_params=sizing_params,
+    )
+    return {
+        'fold_start': test.index.min(),
+        'fold_end': test.index.max(),
+        **metrics,
+        'bars': len(results),
+    }
+
+
 class WalkForwardValidator:
     """Rolling train/test backtest evaluator with optional per-fold calibration."""
 
-    def __init__(self, backtester, train_size: int = 252, test_size: int = 63):
+    def __init__(self, backtester, train_size: int = 252, test_size: int = 63,
+                 n_jobs: Optional[int] = 1):
+        """
+        Args:
+            backtester: Backtester used for every fold
+            train_size: Bars per training window
+            test_size: Bars per test window (and step between folds)
+            n_jobs: Worker processes for folds; 1 runs in-process, None or
+                -1 uses every CPU. Parallel runs need a picklable strategy,
+                backtester, sizer and calibrator.
+        """
         self.backtester = backtester
         self.train_size = train_size
         self.test_size = test_size
+        self.n_jobs = n_jobs
+
+    def _workers(self, n_folds: int) -> int:
+        n_jobs = self.n_jobs
+        if n_jobs is None or n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        return max(1, min(n_jobs, n_folds))
 
     def run(
         self,
@@ -22,32 +83,35 @@ class WalkForwardValidator:
         calibrator: Optional[Callable] = None,
     ) -> Tuple[List[Dict], pd.DataFrame]:
         """Run walk-forward folds and return fold metrics and summary frame."""
-        fold_metrics: List[Dict] = []
-
+        folds = []
         for i in range(0, len(data) - self.train_size - self.test_size + 1, self.test_size):
             train = data.iloc[i:i + self.train_size].copy()
             test = data.iloc[i + self.train_size:i + self.train_size + self.test_size].copy()
             if train.empty or test.empty:
                 continue
+            folds.append((train, test))
 
-            strategy_fold = copy.deepcopy(strategy)
-            if calibrator is not None:
-                calibrator(strategy_fold, train)
-            elif hasattr(strategy_fold, 'fit') and callable(getattr(strategy_fold, 'fit')):
-                strategy_fold.fit(train)
-
-            results, metrics = self.backtester.run(
-                strategy_fold,
-                test,
-                position_sizer=position_sizer,
-                sizing_params=sizing_params,
-            )
-            fold_metrics.append({
-                'fold_start': test.index.min(),
-                'fold_end': test.index.max(),
-                **metrics,
-                'bars': len(results),
-            })
+        # Folds share no state, so they can run in separate processes
+        workers = self._workers(len(folds))
+        if workers > 1:
+            n = len(folds)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+                fold_metrics: List[Dict] = list(pool.map(
+                    _run_fold,
+                    [self.backtester] * n,
+                    [strategy] * n,
+                    [train for train, _ in folds],
+                    [test for _, test in folds],
+                    [position_sizer] * n,
+                    [sizing_params] * n,
+                    [calibrator] * n,
+                ))
+        else:
+            fold_metrics = [
+                _run_fold(self.backtester, strategy, train, test,
+                          position_sizer, sizing_params, calibrator)
+                for train, test in folds
+            ]
 
         summary = pd.DataFrame(fold_metrics)
         return fold_metrics, summary
@@ -6,6 +6,8 @@ Pydantic models for type-safe configuration with validation.
 
 from pydantic import BaseModel, Field, validator
 from typing import Dict, Optional
+from functools import lru_cache
+import copy
 import yaml
 import os
 from pathlib import Path
@@ -167,6 +169,25 @@ def load_config(env: Optional[str] = None) -> Settings:
     if not config_dir.exists():
         raise FileNotFoundError(f"Config directory not found: {config_dir}")
     
+    # Create and validate Settings object; the parsed YAML is cached, the
+    # model is not, so callers never share a mutable instance
+    return Settings(**copy.deepcopy(_read_config_files(str(config_dir.resolve()), env)))
+
+
+@lru_cache(maxsize=8)
+def _read_config_files(config_dir: str, env: str) -> dict:
+    """
+    Parse base.yaml and merge the environment overrides (memoized).
+    
+    Args:
+        config_dir: Absolute path of the config directory
+        env: Environment name
+        
+    Returns:
+        Merged configuration dictionary (treat as read-only)
+    """
+    config_dir = Path(config_dir)
+    
     # Load base config
     base_file = config_dir / 'base.yaml'
     if not base_file.exists():
@@ -182,8 +203,7 @@ def load_config(env: Optional[str] = None) -> Settings:
             env_config = yaml.safe_load(f)
             config = deep_merge(config, env_config)
     
-    # Create and validate Settings object
-    return Settings(**config)
+    return config
 
 
 def deep_merge(base: dict, override: dict) -> dict:
@@ -1,8 +1,9 @@
 """Enhanced Data Validator with logging and robust handling."""
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Tuple
+from typing import Callable, List, Optional, Dict, Tuple
 
 from src.config import get_config
 from src.utils.logger import get_logger
@@ -11,6 +12,27 @@ from src.utils.exceptions import DataValidationError
 logger = get_logger(__name__)
 
 
+# Range checks of validate_ranges() over raw column arrays; any hit hands
+# the frame to the generic path so errors and the report match exactly
+_FASTPATH_TEMPLATE = """
+def validate(df):
+    if tuple(df.columns) != columns:
+        return generic(df)
+    if len(df):
+{loads}
+        if {dtype_mismatch}:
+            return generic(df)
+        if ((c_open <= 0).any() or (c_high <= 0).any() or
+                (c_low <= 0).any() or (c_close <= 0).any() or
+                (c_high < c_low).any() or
+                (c_high < c_open).any() or (c_high < c_close).any() or
+                (c_low > c_open).any() or (c_low > c_close).any() or
+                (c_volume < 0).any()):
+            return generic(df)
+    return validate_staleness(df)
+"""
+
+
 class DataValidator:
     """Validator with duplicate/sorting handling and validation reporting."""
 
@@ -78,13 +100,15 @@ class DataValidator:
         return True
 
     def check_duplicates(self, df: pd.DataFrame) -> Tuple[bool, pd.DataFrame]:
-        duplicates = df['timestamp'].duplicated().sum()
+        if not self.auto_fix:
+            return bool(df['timestamp'].duplicated().any()), df
+
+        # One hashing pass; the removed count falls out of the length change
+        df_clean = df.drop_duplicates(subset=['timestamp'], keep='last')
+        duplicates = len(df) - len(df_clean)
         if duplicates > 0:
-            if self.auto_fix:
-                df_clean = df.drop_duplicates(subset=['timestamp'], keep='last')
-                self.last_report['duplicates_removed'] += int(duplicates)
-                return True, df_clean
-            return True, df
+            self.last_report['duplicates_removed'] += duplicates
+            return True, df_clean
         return False, df
 
     def check_sorted(self, df: pd.DataFrame) -> Tuple[bool, pd.DataFrame]:
@@ -102,13 +126,13 @@ class DataValidator:
 
         max_delay = max_delay_minutes or self.max_delay_minutes
         if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
-            try:
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-            except Exception:
+            parsed = pd.to_datetime(df['timestamp'], errors='coerce')
+            if (parsed.isna() & df['timestamp'].notna()).any():
                 self.last_report['staleness_errors'] += 1
                 if self.fail_on_error:
                     raise DataValidationError("Timestamp column is not convertible to datetime")
                 return False
+            df['timestamp'] = parsed
 
         last_timestamp = df['timestamp'].max()
         if last_timestamp.tzinfo is None:
@@ -150,6 +174,34 @@ class DataValidator:
 
         return df
 
+    def compile_for(self, schema: Dict[str, object]) -> Callable[[pd.DataFrame], bool]:
+        """
+        Build a validate() specialized for frames with this column -> dtype schema.
+        
+        Matching frames are range-checked on their NumPy arrays with the
+        column names and dtypes baked in; anything else (other columns,
+        dtypes, or a failed check) goes through the generic validate().
+        """
+        numeric = self.REQUIRED_COLUMNS[1:]
+        dtypes = {col: schema.get(col) for col in numeric}
+        if 'timestamp' not in schema or not all(
+            isinstance(dtype, np.dtype) and dtype.kind in 'iuf' for dtype in dtypes.values()
+        ):
+            return self.validate
+
+        source = _FASTPATH_TEMPLATE.format(
+            loads='\n'.join(f"        c_{col} = df['{col}'].to_numpy()" for col in numeric),
+            dtype_mismatch=' or '.join(f"c_{col}.dtype != d_{col}" for col in numeric),
+        )
+        namespace = {f'd_{col}': dtype for col, dtype in dtypes.items()}
+        namespace.update(
+            columns=tuple(schema),
+            generic=self.validate,
+            validate_staleness=self.validate_staleness,
+        )
+        exec(compile(source, '<compiled DataValidator.validate>', 'exec'), namespace)
+        return namespace['validate']
+
     def validate(self, df: pd.DataFrame) -> bool:
         try:
             return (self.validate_schema(df) and
@@ -72,9 +72,10 @@ class GapDetector:
         gap_indices = gap_mask[gap_mask].index
         
         for idx in gap_indices:
-            gap_start = df_sorted.loc[idx - 1, 'timestamp']
+            # Labels need not be contiguous (e.g. after dropping rows)
             gap_end = df_sorted.loc[idx, 'timestamp']
-            gap_duration = gap_end - gap_start
+            gap_duration = time_diffs.loc[idx]
+            gap_start = gap_end - gap_duration
             
             gap_info = {
                 'start': gap_start,
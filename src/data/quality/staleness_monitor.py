@@ -45,12 +45,13 @@ class StalenessMonitor:
             'threshold_minutes': self.threshold_minutes
         })
     
-    def check_staleness(self, df: pd.DataFrame) -> Dict:
+    def check_staleness(self, df: pd.DataFrame, now: Optional[datetime] = None) -> Dict:
         """
         Check data staleness and log alerts.
         
         Args:
             df: DataFrame with timestamp column
+            now: Reference time (UTC); defaults to the current time
             
         Returns:
             Dictionary with staleness info
@@ -68,7 +69,8 @@ class StalenessMonitor:
         else:
             last_timestamp = last_timestamp.tz_convert('UTC')
         
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         age = now - last_timestamp
         age_minutes = age.total_seconds() / 60
         
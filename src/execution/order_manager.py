@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timezone
 import uuid
 
@@ -49,6 +49,19 @@ class PaperOrder:
 class OrderManager:
     """Tracks order lifecycle and enforces pre-submission controls."""
 
+    # (state, event) -> (new state, counted in state_counts); missing pairs are illegal
+    _TRANSITIONS: Dict[Tuple[OrderState, str], Tuple[OrderState, bool]] = {
+        (OrderState.CREATED, 'submit'): (OrderState.SUBMITTED, True),
+        (OrderState.CREATED, 'reject'): (OrderState.REJECTED, True),
+        (OrderState.SUBMITTED, 'fill_none'): (OrderState.SUBMITTED, False),
+        (OrderState.SUBMITTED, 'fill_partial'): (OrderState.PARTIALLY_FILLED, True),
+        (OrderState.SUBMITTED, 'fill_full'): (OrderState.FILLED, True),
+        (OrderState.SUBMITTED, 'cancel'): (OrderState.CANCELED, True),
+        (OrderState.PARTIALLY_FILLED, 'fill_partial'): (OrderState.PARTIALLY_FILLED, True),
+        (OrderState.PARTIALLY_FILLED, 'fill_full'): (OrderState.FILLED, True),
+        (OrderState.PARTIALLY_FILLED, 'cancel'): (OrderState.CANCELED, True),
+    }
+
     def __init__(self, risk_limits=None, max_daily_loss_abs: float = 0.0):
         self.risk_limits = risk_limits
         self.max_daily_loss_abs = max_daily_loss_abs
@@ -75,13 +88,24 @@ class OrderManager:
             return RejectReason.INVALID_ORDER
         return None
 
+    def _lookup_transition(self, order: PaperOrder, event: str) -> Tuple[OrderState, bool]:
+        try:
+            return self._TRANSITIONS[(order.status, event)]
+        except KeyError:
+            raise ValueError(f"Cannot {event} order {order.id} in state {order.status.value}") from None
+
+    def _transition(self, order: PaperOrder, event: str) -> None:
+        new_state, counted = self._lookup_transition(order, event)
+        order.status = new_state
+        order.updated_at = datetime.now(timezone.utc)
+        if counted:
+            self.state_counts[new_state.value] += 1
+
     def _mark_rejected(self, order: PaperOrder, reason: RejectReason) -> PaperOrder:
-        order.status = OrderState.REJECTED
+        self._transition(order, 'reject')
         order.reject_reason = reason.value
-        order.updated_at = datetime.now(timezone.utc)
         self.orders[order.id] = order
         self.rejection_counters[reason.value] += 1
-        self.state_counts[OrderState.REJECTED.value] += 1
         logger.warning('Order rejected', extra={
             'order_id': order.id,
             'symbol': order.symbol,
@@ -91,8 +115,7 @@ class OrderManager:
         return order
 
     def submit_order(self, order: PaperOrder, current_equity: Optional[float] = None, open_positions: Optional[List] = None):
-        open_positions = open_positions or []
-
+        # Without open_positions the risk check reads its running RiskState totals
         if self.kill_switch:
             return self._mark_rejected(order, RejectReason.KILL_SWITCH)
 
@@ -117,10 +140,8 @@ class OrderManager:
                 logger.warning('Risk check rejected order', extra={'order_id': order.id, 'reason': reason})
                 return self._mark_rejected(order, RejectReason.RISK_CHECK_FAILED)
 
-        order.status = OrderState.SUBMITTED
-        order.updated_at = datetime.now(timezone.utc)
+        self._transition(order, 'submit')
         self.orders[order.id] = order
-        self.state_counts[OrderState.SUBMITTED.value] += 1
         logger.info('Order submitted', extra={'order_id': order.id, 'symbol': order.symbol, 'status': order.status.value})
         return order
 
@@ -129,22 +150,22 @@ class OrderManager:
         fill_qty = max(0.0, min(fill_qty, order.quantity - order.filled_quantity))
 
         new_total_qty = order.filled_quantity + fill_qty
+        if new_total_qty == 0:
+            event = 'fill_none'
+        elif new_total_qty < order.quantity:
+            event = 'fill_partial'
+        else:
+            event = 'fill_full'
+        # Validate before touching fill state so an illegal fill changes nothing
+        self._lookup_transition(order, event)
+
         if new_total_qty > 0:
             order.avg_fill_price = (
                 (order.avg_fill_price * order.filled_quantity) + (fill_price * fill_qty)
             ) / new_total_qty
         order.filled_quantity = new_total_qty
+        self._transition(order, event)
 
-        if order.filled_quantity == 0:
-            order.status = OrderState.SUBMITTED
-        elif order.filled_quantity < order.quantity:
-            order.status = OrderState.PARTIALLY_FILLED
-            self.state_counts[OrderState.PARTIALLY_FILLED.value] += 1
-        else:
-            order.status = OrderState.FILLED
-            self.state_counts[OrderState.FILLED.value] += 1
-
-        order.updated_at = datetime.now(timezone.utc)
         logger.info('Order fill update', extra={
             'order_id': order.id,
             'symbol': order.symbol,
@@ -156,9 +177,7 @@ class OrderManager:
 
     def cancel_order(self, order_id: str) -> PaperOrder:
         order = self.orders[order_id]
-        order.status = OrderState.CANCELED
-        order.updated_at = datetime.now(timezone.utc)
-        self.state_counts[OrderState.CANCELED.value] += 1
+        self._transition(order, 'cancel')
         logger.info('Order canceled', extra={'order_id': order.id, 'symbol': order.symbol, 'status': order.status.value})
         return order
 
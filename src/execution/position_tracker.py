@@ -1,7 +1,7 @@
 """Position tracking and PnL accounting for paper trading."""
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
 
 from src.utils.logger import get_logger
 
@@ -21,13 +21,18 @@ class PositionSnapshot:
 
 
 class PositionTracker:
-    def __init__(self):
+    def __init__(self, risk_state=None):
         self.positions: Dict[str, PositionSnapshot] = {}
         self.realized_pnl: float = 0.0
+        # Optional RiskState (e.g. RiskLimits.state) kept in step with fills
+        self.risk_state = risk_state
 
-    def apply_fill(self, symbol: str, side: str, quantity: float, price: float) -> None:
+    def apply_fill(self, symbol: str, side: str, quantity: float, price: float,
+                   sector: Optional[str] = None, cluster: Optional[str] = None) -> None:
         pos = self.positions.get(symbol, PositionSnapshot(symbol=symbol, quantity=0.0, avg_entry_price=0.0, last_price=price))
         signed_qty = quantity if side == 'buy' else -quantity
+        if self.risk_state is not None:
+            self.risk_state.update_on_fill(symbol, signed_qty, price, sector=sector, cluster=cluster)
 
         if pos.quantity == 0 or (pos.quantity > 0 and signed_qty > 0) or (pos.quantity < 0 and signed_qty < 0):
             new_qty = pos.quantity + signed_qty
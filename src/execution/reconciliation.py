@@ -26,20 +26,23 @@ class ReconciliationEngine:
 
     def __init__(self, drift_tolerance: float = 1e-6):
         self.drift_tolerance = drift_tolerance
-        self.daily_results: List[ReconciliationResult] = []
+        self.reset_day()
 
     def reconcile(self, expected: Dict, actual: Dict) -> ReconciliationResult:
         mismatches = []
 
         exp_pos = expected.get('positions', {})
         act_pos = actual.get('positions', {})
-        if set(exp_pos.keys()) != set(act_pos.keys()):
+        # Key views support set ops directly, without building sets
+        common = exp_pos.keys() & act_pos.keys()
+        if len(common) != len(exp_pos) or len(common) != len(act_pos):
             mismatches.append('position_symbol_set_mismatch')
 
         drift_abs = 0.0
-        for sym in set(exp_pos.keys()).intersection(act_pos.keys()):
-            drift_abs += abs(exp_pos[sym].get('quantity', 0.0) - act_pos[sym].get('quantity', 0.0))
-            drift_abs += abs(exp_pos[sym].get('avg_entry_price', 0.0) - act_pos[sym].get('avg_entry_price', 0.0))
+        for sym in common:
+            exp, act = exp_pos[sym], act_pos[sym]
+            drift_abs += (abs(exp.get('quantity', 0.0) - act.get('quantity', 0.0))
+                          + abs(exp.get('avg_entry_price', 0.0) - act.get('avg_entry_price', 0.0)))
 
         if drift_abs > self.drift_tolerance:
             mismatches.append('position_drift_exceeded')
@@ -55,6 +58,9 @@ class ReconciliationEngine:
             missing_updates=missing_updates,
         )
         self.daily_results.append(result)
+        self._failed_runs += not result.ok
+        self._max_drift_abs = max(self._max_drift_abs, drift_abs)
+        self._total_missing_updates += missing_updates
         logger.info('Reconciliation run', extra={
             'ok': result.ok,
             'mismatches': mismatches,
@@ -65,16 +71,20 @@ class ReconciliationEngine:
 
     def daily_summary(self) -> Dict:
         total = len(self.daily_results)
-        failed = sum(1 for r in self.daily_results if not r.ok)
+        failed = self._failed_runs
         summary = {
             'runs': total,
             'failed_runs': failed,
             'success_rate': (total - failed) / total if total else 1.0,
-            'max_drift_abs': max((r.drift_abs for r in self.daily_results), default=0.0),
-            'total_missing_updates': sum(r.missing_updates for r in self.daily_results),
+            'max_drift_abs': self._max_drift_abs,
+            'total_missing_updates': self._total_missing_updates,
         }
         logger.info('Daily reconciliation summary', extra=summary)
         return summary
 
     def reset_day(self) -> None:
-        self.daily_results = []
+        self.daily_results: List[ReconciliationResult] = []
+        # Running totals so daily_summary doesn't rescan every run
+        self._failed_runs = 0
+        self._max_drift_abs = 0.0
+        self._total_missing_updates = 0
@@ -1,14 +1,19 @@
 """Simulated exchange for paper-trading with depth-aware fills."""
 
+import logging
 import random
 import time
-from typing import Dict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from src.utils.logger import get_logger
 from src.execution.order_manager import PaperOrder
 
 logger = get_logger(__name__)
 
+_LATENCY_BUCKETS_MS = np.array([0.0, 1.0, 5.0, 20.0, np.inf])
+
 
 class SimulatedExchange:
     """Applies synthetic fill logic and tracks latency histograms."""
@@ -23,17 +28,8 @@ class SimulatedExchange:
         self.fill_latency_ms.append(latency)
 
     def _latency_histogram(self) -> Dict[str, int]:
-        bins = {'lt1ms': 0, '1to5ms': 0, '5to20ms': 0, '20ms_plus': 0}
-        for lat in self.fill_latency_ms:
-            if lat < 1:
-                bins['lt1ms'] += 1
-            elif lat < 5:
-                bins['1to5ms'] += 1
-            elif lat < 20:
-                bins['5to20ms'] += 1
-            else:
-                bins['20ms_plus'] += 1
-        return bins
+        counts, _ = np.histogram(self.fill_latency_ms, bins=_LATENCY_BUCKETS_MS)
+        return dict(zip(('lt1ms', '1to5ms', '5to20ms', '20ms_plus'), counts.tolist()))
 
     def execute(self, order: PaperOrder, market_price: float, book_depth: float = 1.0, volatility: float = 0.0) -> Dict:
         """Execute order and return fill payload with possible partial fill."""
@@ -72,6 +68,67 @@ class SimulatedExchange:
         logger.info('Simulated fill', extra={**payload, 'order_type': order.order_type, 'symbol': order.symbol})
         return payload
 
+    def execute_batch(self,
+                      orders: Sequence[PaperOrder],
+                      market_prices: Sequence[float],
+                      book_depths: Optional[Sequence[float]] = None,
+                      volatilities: Optional[Sequence[float]] = None) -> List[Dict]:
+        """Execute many orders at once; fill math runs over arrays.
+
+        Mirrors ``execute`` (kept scalar, where array setup would dominate).
+        Jitter is drawn from ``self.rng`` in order, so a batch fills exactly
+        like the same orders passed to ``execute`` one by one.
+        """
+        started = time.perf_counter()
+        n = len(orders)
+        market_price = np.asarray(market_prices, dtype=np.float64)
+        book_depth = np.ones(n) if book_depths is None else np.asarray(book_depths, dtype=np.float64)
+        volatility = np.zeros(n) if volatilities is None else np.asarray(volatilities, dtype=np.float64)
+
+        quantity = np.array([order.quantity for order in orders], dtype=np.float64)
+        is_buy = np.array([order.side == 'buy' for order in orders], dtype=bool)
+        is_market = np.array([order.order_type == 'market' for order in orders], dtype=bool)
+        limit_price = np.array([np.nan if order.limit_price is None else order.limit_price for order in orders],
+                               dtype=np.float64)
+
+        # Market orders fill in full with volatility slippage against the taker
+        slippage = np.fmin(0.01, np.fmax(0.0, volatility * 0.5))
+        market_fill = market_price * np.where(is_buy, 1 + slippage, 1 - slippage)
+
+        # Limit orders fill at the limit, partially by depth and volatility
+        has_limit = ~is_market & ~np.isnan(limit_price)
+        price_ok = has_limit & np.where(is_buy, market_price <= limit_price, market_price >= limit_price)
+        depth_factor = np.fmin(1.0, np.fmax(0.0, book_depth / np.fmax(quantity, 1e-9)))
+        vol_penalty = np.fmax(0.05, 1.0 - volatility * 5.0)
+        jitter = np.ones(n)
+        jitter[price_ok] = [self.rng.uniform(0.85, 1.0) for _ in range(int(price_ok.sum()))]
+        limit_ratio = np.where(price_ok, np.fmin(1.0, np.fmax(0.0, depth_factor * vol_penalty * jitter)), 0.0)
+
+        fill_ratio = np.where(is_market, 1.0, limit_ratio)
+        fill_price = np.where(is_market, market_fill, np.where(has_limit, limit_price, market_price))
+        filled_qty = quantity * fill_ratio
+        status = np.where(fill_ratio >= 0.999, 'filled', np.where(fill_ratio > 0, 'partially_filled', 'unfilled'))
+
+        self.fill_events += n
+        latency = (time.perf_counter() - started) * 1000.0 / max(n, 1)
+        self.fill_latency_ms.extend([latency] * n)
+
+        payloads = [
+            {
+                'order_id': order.id,
+                'filled_qty': qty,
+                'fill_price': price,
+                'fill_ratio': ratio,
+                'status': state,
+            }
+            for order, qty, price, ratio, state in zip(
+                orders, filled_qty.tolist(), fill_price.tolist(), fill_ratio.tolist(), status.tolist())
+        ]
+        if logger.isEnabledFor(logging.INFO):
+            for order, payload in zip(orders, payloads):
+                logger.info('Simulated fill', extra={**payload, 'order_type': order.order_type, 'symbol': order.symbol})
+        return payloads
+
     def get_metrics(self) -> Dict:
         return {
             'fill_events': self.fill_events,
@@ -12,12 +12,14 @@ Modules:
     - validation: Lookahead bias detection and feature health monitoring
 """
 
-from src.features.base_feature import BaseFeature
+from src.features.base_feature import BaseFeature, OHLCV_COLUMNS, feature_columns
 from src.features.price_features import PriceFeatures
 from src.features.technical_indicators import TechnicalIndicators
 
 __all__ = [
     'BaseFeature',
+    'OHLCV_COLUMNS',
+    'feature_columns',
     'PriceFeatures',
     'TechnicalIndicators',
 ]
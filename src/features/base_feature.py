@@ -13,6 +13,21 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+OHLCV_COLUMNS = frozenset({'timestamp', 'open', 'high', 'low', 'close', 'volume'})
+
+
+def feature_columns(df: pd.DataFrame) -> pd.Index:
+    """
+    Columns of df other than the raw OHLCV inputs, in frame order.
+    
+    Args:
+        df: DataFrame with OHLCV data and computed features
+        
+    Returns:
+        Index of feature column names
+    """
+    return df.columns.difference(OHLCV_COLUMNS, sort=False)
+
 
 class BaseFeature(ABC):
     """
@@ -23,14 +38,26 @@ class BaseFeature(ABC):
     future information (lookahead bias).
     """
     
-    def __init__(self, validate_lookahead: bool = True):
+    def __init__(self, validate_lookahead: bool = True,
+                 engine: Optional[str] = None,
+                 engine_kwargs: Optional[dict] = None):
         """
         Initialize base feature.
         
         Args:
             validate_lookahead: If True, run lookahead validation after compute
+            engine: pandas window engine for rolling/ewm aggregations
+                ('cython', 'numba', or None for the pandas default)
+            engine_kwargs: Options for the numba engine (nopython, nogil, parallel)
         """
         self.validate_lookahead = validate_lookahead
+        self.engine = engine
+        self.engine_kwargs = engine_kwargs
+        
+        # Splatted into every rolling/ewm aggregation by subclasses
+        self._window_kwargs = {}
+        if engine is not None:
+            self._window_kwargs = {'engine': engine, 'engine_kwargs': engine_kwargs}
         
     @abstractmethod
     def compute(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -113,13 +113,13 @@ class PriceFeatures(BaseFeature):
         
         for w in windows:
             # Rolling standard deviation of returns
-            df[f'volatility_{w}'] = returns.rolling(window=w).std()
+            df[f'volatility_{w}'] = returns.rolling(window=w).std(**self._window_kwargs)
             cols.append(f'volatility_{w}')
             
             # Parkinson volatility (uses high-low range)
             # More efficient estimator than close-to-close
             df[f'parkinson_vol_{w}'] = np.sqrt(
-                (np.log(df['high'] / df['low']) ** 2).rolling(window=w).mean() / (4 * np.log(2))
+                (np.log(df['high'] / df['low']) ** 2).rolling(window=w).mean(**self._window_kwargs) / (4 * np.log(2))
             )
             cols.append(f'parkinson_vol_{w}')
             
@@ -142,9 +142,9 @@ class PriceFeatures(BaseFeature):
         cols = []
         
         # Simple moving averages
-        df['sma_20'] = df['close'].rolling(window=20).mean()
-        df['sma_50'] = df['close'].rolling(window=50).mean()
-        df['sma_200'] = df['close'].rolling(window=200).mean()
+        df['sma_20'] = df['close'].rolling(window=20).mean(**self._window_kwargs)
+        df['sma_50'] = df['close'].rolling(window=50).mean(**self._window_kwargs)
+        df['sma_200'] = df['close'].rolling(window=200).mean(**self._window_kwargs)
         
         # Price ratios (>1 means price above average)
         df['price_to_sma20'] = df['close'] / df['sma_20']
@@ -160,8 +160,8 @@ class PriceFeatures(BaseFeature):
         cols.extend(['sma20_to_sma50', 'sma50_to_sma200'])
         
         # Distance from high/low
-        df['pct_from_high'] = (df['close'] - df['high'].rolling(20).max()) / df['high'].rolling(20).max()
-        df['pct_from_low'] = (df['close'] - df['low'].rolling(20).min()) / df['low'].rolling(20).min()
+        df['pct_from_high'] = (df['close'] - df['high'].rolling(20).max(**self._window_kwargs)) / df['high'].rolling(20).max(**self._window_kwargs)
+        df['pct_from_low'] = (df['close'] - df['low'].rolling(20).min(**self._window_kwargs)) / df['low'].rolling(20).min(**self._window_kwargs)
         
         cols.extend(['pct_from_high', 'pct_from_low'])
         
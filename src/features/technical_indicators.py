@@ -89,8 +89,8 @@ class TechnicalIndicators(BaseFeature):
         loss = -delta.where(delta < 0, 0)
         
         # Calculate average gain and loss using EMA
-        avg_gain = gain.ewm(alpha=1/window, min_periods=window).mean()
-        avg_loss = loss.ewm(alpha=1/window, min_periods=window).mean()
+        avg_gain = gain.ewm(alpha=1/window, min_periods=window).mean(**self._window_kwargs)
+        avg_loss = loss.ewm(alpha=1/window, min_periods=window).mean(**self._window_kwargs)
         
         # Calculate RS and RSI
         rs = avg_gain / (avg_loss + 1e-10)  # Add small value to avoid division by zero
@@ -124,14 +124,14 @@ class TechnicalIndicators(BaseFeature):
         df = df.copy()
         
         # Calculate EMAs
-        ema_fast = df['close'].ewm(span=fast, adjust=False).mean()
-        ema_slow = df['close'].ewm(span=slow, adjust=False).mean()
+        ema_fast = df['close'].ewm(span=fast, adjust=False).mean(**self._window_kwargs)
+        ema_slow = df['close'].ewm(span=slow, adjust=False).mean(**self._window_kwargs)
         
         # MACD line
         df['macd'] = ema_fast - ema_slow
         
         # Signal line
-        df['macd_signal'] = df['macd'].ewm(span=signal, adjust=False).mean()
+        df['macd_signal'] = df['macd'].ewm(span=signal, adjust=False).mean(**self._window_kwargs)
         
         # MACD histogram
         df['macd_hist'] = df['macd'] - df['macd_signal']
@@ -161,10 +161,10 @@ class TechnicalIndicators(BaseFeature):
         df = df.copy()
         
         # Middle band (SMA)
-        df['bb_middle'] = df['close'].rolling(window=window).mean()
+        df['bb_middle'] = df['close'].rolling(window=window).mean(**self._window_kwargs)
         
         # Standard deviation
-        rolling_std = df['close'].rolling(window=window).std()
+        rolling_std = df['close'].rolling(window=window).std(**self._window_kwargs)
         
         # Upper and lower bands
         df['bb_upper'] = df['bb_middle'] + (std * rolling_std)
@@ -193,13 +193,13 @@ class TechnicalIndicators(BaseFeature):
         df = df.copy()
         
         # Simple Moving Averages
-        df['sma_10'] = df['close'].rolling(window=10).mean()
-        df['sma_20'] = df['close'].rolling(window=20).mean()
-        df['sma_50'] = df['close'].rolling(window=50).mean()
+        df['sma_10'] = df['close'].rolling(window=10).mean(**self._window_kwargs)
+        df['sma_20'] = df['close'].rolling(window=20).mean(**self._window_kwargs)
+        df['sma_50'] = df['close'].rolling(window=50).mean(**self._window_kwargs)
         
         # Exponential Moving Averages
-        df['ema_12'] = df['close'].ewm(span=12, adjust=False).mean()
-        df['ema_26'] = df['close'].ewm(span=26, adjust=False).mean()
+        df['ema_12'] = df['close'].ewm(span=12, adjust=False).mean(**self._window_kwargs)
+        df['ema_26'] = df['close'].ewm(span=26, adjust=False).mean(**self._window_kwargs)
         
         logger.debug("Added moving averages (SMA: 10,20,50; EMA: 12,26)")
         return df
@@ -224,13 +224,13 @@ class TechnicalIndicators(BaseFeature):
         df = df.copy()
         
         # Calculate %K
-        low_min = df['low'].rolling(window=k_window).min()
-        high_max = df['high'].rolling(window=k_window).max()
+        low_min = df['low'].rolling(window=k_window).min(**self._window_kwargs)
+        high_max = df['high'].rolling(window=k_window).max(**self._window_kwargs)
         
         df['stoch_k'] = 100 * (df['close'] - low_min) / (high_max - low_min + 1e-10)
         
         # Calculate %D (smoothed %K)
-        df['stoch_d'] = df['stoch_k'].rolling(window=d_window).mean()
+        df['stoch_d'] = df['stoch_k'].rolling(window=d_window).mean(**self._window_kwargs)
         
         logger.debug(f"Added Stochastic with k_window={k_window}, d_window={d_window}")
         return df
@@ -258,7 +258,7 @@ class TechnicalIndicators(BaseFeature):
         true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
         
         # Average True Range (EMA of TR)
-        df['atr'] = true_range.ewm(alpha=1/window, min_periods=window).mean()
+        df['atr'] = true_range.ewm(alpha=1/window, min_periods=window).mean(**self._window_kwargs)
         
         logger.debug(f"Added ATR with window={window}")
         return df
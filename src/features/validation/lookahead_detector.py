@@ -15,6 +15,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two equal-length, NaN-free arrays."""
+    x = x - x.mean()
+    y = y - y.mean()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return float(np.dot(x, y) / np.sqrt(np.dot(x, x) * np.dot(y, y)))
+
+
 class LookaheadDetector:
     """
     Detects if features contain future information (lookahead bias).
@@ -72,6 +80,10 @@ class LookaheadDetector:
             
         results = {}
         
+        # Future returns depend only on price, so build them once for all features
+        future_returns = self._future_returns(df[price_col].to_numpy(dtype=np.float64))
+        future_valid = ~np.isnan(future_returns)
+        
         for col in feature_cols:
             if col not in df.columns:
                 results[col] = {
@@ -85,17 +97,19 @@ class LookaheadDetector:
             max_corr = 0
             worst_period = 0
             
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            feature_valid = ~np.isnan(values)
+            
             for period in range(1, self.forward_periods + 1):
-                # Calculate future return
-                future_return = df[price_col].pct_change(period).shift(-period)
+                future_return = future_returns[period - 1]
                 
                 # Skip if too many NaN values
-                valid_mask = ~(df[col].isna() | future_return.isna())
-                if valid_mask.sum() < 20:
+                valid_mask = feature_valid & future_valid[period - 1]
+                if np.count_nonzero(valid_mask) < 20:
                     continue
                     
                 # Calculate correlation
-                corr = df.loc[valid_mask, col].corr(future_return[valid_mask])
+                corr = _pearson(values[valid_mask], future_return[valid_mask])
                 correlations[period] = corr
                 
                 # Track maximum absolute correlation
@@ -134,6 +148,24 @@ class LookaheadDetector:
                 
         return results
     
+    def _future_returns(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Forward returns for each horizon in 1..forward_periods.
+        
+        Row ``period - 1`` matches ``pct_change(period).shift(-period)``;
+        the trailing ``period`` entries are NaN.
+        """
+        n = len(prices)
+        future_returns = np.full((self.forward_periods, n), np.nan)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for period in range(1, min(self.forward_periods, n - 1) + 1):
+                row = future_returns[period - 1, :n - period]
+                np.divide(prices[period:], prices[:-period], out=row)
+                row -= 1.0
+                
+        return future_returns
+    
     def verify_no_lookahead(self, df: pd.DataFrame, 
                            feature_cols: List[str],
                            raise_on_fail: bool = True) -> bool:
@@ -9,6 +9,6 @@ Modules:
     - circuit_breaker: Auto-pause on risk violations
 """
 
-from src.risk.limits import RiskLimits
+from src.risk.limits import RiskLimits, RiskState
 
-__all__ = ['RiskLimits']
+__all__ = ['RiskLimits', 'RiskState']
@@ -1,7 +1,7 @@
 """Risk Limits with concentration and cluster controls."""
 
 from typing import Dict, Tuple, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 logger = logging.getLogger(__name__)
@@ -54,6 +54,79 @@ class Order:
         return abs(self.quantity) * abs(self.price - self.stop_loss)
 
 
+@dataclass
+class RiskState:
+    """
+    Running exposure totals keyed by symbol, sector and cluster.
+
+    Kept current from fills (see ``PositionTracker``) so ``check_order`` can
+    look exposures up instead of re-summing every open position. Risk uses
+    the 2%-of-notional default, as fills carry no stop level.
+    """
+    symbol_quantity: Dict[str, float] = field(default_factory=dict)
+    symbol_notional: Dict[str, float] = field(default_factory=dict)
+    sector_notional: Dict[str, float] = field(default_factory=dict)
+    cluster_notional: Dict[str, float] = field(default_factory=dict)
+    symbol_sector: Dict[str, str] = field(default_factory=dict)
+    symbol_cluster: Dict[str, str] = field(default_factory=dict)
+    total_notional: float = 0.0
+
+    @property
+    def total_risk(self) -> float:
+        return self.total_notional * 0.02
+
+    def update_on_fill(self,
+                       symbol: str,
+                       delta_qty: float,
+                       price: float,
+                       sector: Optional[str] = None,
+                       cluster: Optional[str] = None) -> None:
+        """Apply a signed fill and re-mark the symbol at the fill price."""
+        old_notional = self.symbol_notional.get(symbol, 0.0)
+        quantity = self.symbol_quantity.get(symbol, 0.0) + delta_qty
+        notional = abs(quantity) * price
+
+        if quantity == 0:
+            self.symbol_quantity.pop(symbol, None)
+            self.symbol_notional.pop(symbol, None)
+        else:
+            self.symbol_quantity[symbol] = quantity
+            self.symbol_notional[symbol] = notional
+        self.total_notional += notional - old_notional
+
+        self._rebucket(self.sector_notional, self.symbol_sector, symbol, sector, old_notional, notional)
+        self._rebucket(self.cluster_notional, self.symbol_cluster, symbol, cluster, old_notional, notional)
+
+    @staticmethod
+    def _rebucket(buckets: Dict[str, float],
+                  tags: Dict[str, str],
+                  symbol: str,
+                  tag: Optional[str],
+                  old_notional: float,
+                  notional: float) -> None:
+        # Whole-symbol move, so a tag first seen (or changed) on a later
+        # fill carries the notional already held, not just this fill's delta
+        previous = tags.get(symbol)
+        if tag is None:
+            tag = previous
+        else:
+            tags[symbol] = tag
+        if previous is not None:
+            buckets[previous] -= old_notional
+        if tag is not None:
+            buckets[tag] = buckets.get(tag, 0.0) + notional
+
+    def correlated_exposure(self,
+                            symbol: str,
+                            correlation_map: Optional[Dict[str, Dict[str, float]]],
+                            threshold: float) -> float:
+        if not correlation_map:
+            return 0.0
+        return sum(self.symbol_notional.get(other, 0.0)
+                   for other, corr in correlation_map.get(symbol, {}).items()
+                   if abs(corr) >= threshold)
+
+
 class RiskLimits:
     """Risk limit enforcement system."""
 
@@ -73,6 +146,7 @@ class RiskLimits:
         self.equity_peak = 0
         self.daily_start_equity = 0
         self.trading_halted = False
+        self.state = RiskState()
 
     def _drawdown(self, current_equity: float) -> float:
         self.equity_peak = max(self.equity_peak, current_equity)
@@ -100,47 +174,83 @@ class RiskLimits:
                 correlated += pos.value
         return correlated
 
+    def _position_exposures(self,
+                            order: Order,
+                            open_positions: List[Position],
+                            correlation_map: Optional[Dict[str, Dict[str, float]]]) -> Tuple[float, ...]:
+        return (
+            self._symbol_exposure(order.symbol, open_positions),
+            self._exposure_by(open_positions, 'sector', order.sector),
+            self._exposure_by(open_positions, 'cluster', order.cluster),
+            sum(p.risk for p in open_positions),
+            self._correlated_exposure(order, open_positions, correlation_map),
+        )
+
+    def _state_exposures(self,
+                         order: Order,
+                         correlation_map: Optional[Dict[str, Dict[str, float]]]) -> Tuple[float, ...]:
+        state = self.state
+        return (
+            state.symbol_notional.get(order.symbol, 0.0),
+            state.sector_notional.get(order.sector, 0.0) if order.sector is not None else 0.0,
+            state.cluster_notional.get(order.cluster, 0.0) if order.cluster is not None else 0.0,
+            state.total_risk,
+            state.correlated_exposure(order.symbol, correlation_map, self.correlation_threshold),
+        )
+
     def check_order(self,
                     order: Order,
                     current_equity: float,
-                    open_positions: List[Position],
+                    open_positions: Optional[List[Position]] = None,
                     correlation_map: Optional[Dict[str, Dict[str, float]]] = None) -> Tuple[bool, str]:
+        """
+        Check an order against all limits.
+
+        Exposures are summed from ``open_positions`` when given, otherwise
+        read from the running totals in ``self.state``.
+        """
         if self.trading_halted:
             return False, "Trading halted due to risk violation"
 
+        if open_positions is None:
+            exposures = self._state_exposures(order, correlation_map)
+        else:
+            exposures = self._position_exposures(order, open_positions, correlation_map)
+        symbol_exposure, sector_exposure, cluster_exposure, open_risk, correlated_exposure = exposures
+
         position_value = order.value
         max_position_value = self.max_position_size * current_equity
         if position_value > max_position_value:
             return False, (f"Position size ${position_value:.2f} exceeds "
                            f"{self.max_position_size:.1%} limit (${max_position_value:.2f})")
 
-        symbol_exposure_new = self._symbol_exposure(order.symbol, open_positions) + position_value
+        symbol_exposure_new = symbol_exposure + position_value
         max_symbol_value = self.max_symbol_exposure * current_equity
         if symbol_exposure_new > max_symbol_value:
             return False, (f"Symbol exposure ${symbol_exposure_new:.2f} exceeds "
                            f"{self.max_symbol_exposure:.1%} limit (${max_symbol_value:.2f})")
 
-        sector_exposure_new = self._exposure_by(open_positions, 'sector', order.sector) + position_value
+        sector_exposure_new = sector_exposure + position_value
         if order.sector is not None:
             max_sector_value = self.max_sector_exposure * current_equity
             if sector_exposure_new > max_sector_value:
                 return False, (f"Sector exposure ${sector_exposure_new:.2f} exceeds "
                                f"{self.max_sector_exposure:.1%} limit (${max_sector_value:.2f})")
 
-        cluster_exposure_new = self._exposure_by(open_positions, 'cluster', order.cluster) + position_value
+        cluster_exposure_new = cluster_exposure + position_value
         if order.cluster is not None:
             max_cluster_value = self.max_cluster_exposure * current_equity
             if cluster_exposure_new > max_cluster_value:
                 return False, (f"Cluster exposure ${cluster_exposure_new:.2f} exceeds "
                                f"{self.max_cluster_exposure:.1%} limit (${max_cluster_value:.2f})")
 
-        new_total_risk = sum(p.risk for p in open_positions) + order.risk
+        new_total_risk = open_risk + order.risk
         max_risk = self.max_portfolio_heat * current_equity
         if new_total_risk > max_risk:
             return False, (f"Portfolio heat ${new_total_risk:.2f} exceeds "
                            f"{self.max_portfolio_heat:.1%} limit (${max_risk:.2f})")
 
-        correlated_exposure_new = self._correlated_exposure(order, open_positions, correlation_map) + position_value
+        correlated_exposure_new = correlated_exposure + position_value
         max_corr_value = self.max_correlated_exposure * current_equity
         if correlated_exposure_new > max_corr_value:
             return False, (f"Correlated exposure ${correlated_exposure_new:.2f} exceeds "
@@ -4,6 +4,7 @@ Mean Reversion Trading Strategy
 Simple mean reversion strategy using Bollinger Bands and RSI.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
 import logging
@@ -42,10 +43,10 @@ class MeanReversionStrategy(BaseStrategy):
             calibrated = min(0.10, max(0.01, ret_std * 6.0))
             self.stop_loss_pct = calibrated
 
-    def _get_stop_price(self, row: pd.Series, entry_price: float, side: int) -> float:
+    def _get_stop_price(self, atr: float, entry_price: float, side: int) -> float:
         fixed_stop = entry_price * (1 - self.stop_loss_pct) if side == 1 else entry_price * (1 + self.stop_loss_pct)
-        if self.atr_stop_mult > 0 and 'atr' in row and pd.notna(row['atr']):
-            atr_stop = entry_price - self.atr_stop_mult * row['atr'] if side == 1 else entry_price + self.atr_stop_mult * row['atr']
+        if self.atr_stop_mult > 0 and not np.isnan(atr):
+            atr_stop = entry_price - self.atr_stop_mult * atr if side == 1 else entry_price + self.atr_stop_mult * atr
             return max(fixed_stop, atr_stop) if side == 1 else min(fixed_stop, atr_stop)
         return fixed_stop
 
@@ -63,34 +64,41 @@ class MeanReversionStrategy(BaseStrategy):
         buy_condition = (df['close'] < df['bb_lower']) & (df['rsi'] < self.rsi_oversold)
         sell_condition = (df['close'] > df['bb_upper']) & (df['rsi'] > self.rsi_overbought)
 
-        signals = []
+        # Materialize each column once; the loop below reads plain floats
+        close = df['close'].to_numpy(dtype=np.float64)
+        bb_middle = df['bb_middle'].to_numpy(dtype=np.float64)
+        rsi = df['rsi'].to_numpy(dtype=np.float64)
+        atr = df['atr'].to_numpy(dtype=np.float64)
+        buy = buy_condition.to_numpy(dtype=bool)
+        sell = sell_condition.to_numpy(dtype=bool)
+
+        signals = np.zeros(len(df), dtype=int)
         current_position = 0
         entry_price = None
         stop_price = None
         bars_in_trade = 0
 
-        for idx, row in df.iterrows():
-            if self.volatility_kill_switch > 0 and pd.notna(row.get('atr')) and row['close'] > 0:
-                atr_pct = row['atr'] / row['close']
+        for i in range(len(df)):
+            if self.volatility_kill_switch > 0 and not np.isnan(atr[i]) and close[i] > 0:
+                atr_pct = atr[i] / close[i]
                 if atr_pct >= self.volatility_kill_switch:
                     current_position = 0
                     entry_price = None
                     stop_price = None
                     bars_in_trade = 0
-                    signals.append(0)
                     continue
 
             exit_now = False
             if current_position != 0:
                 bars_in_trade += 1
                 if current_position == 1:
-                    mean_exit = (row['close'] > row['bb_middle']) or (row['rsi'] > self.rsi_overbought)
-                    stop_exit = stop_price is not None and row['close'] <= stop_price
+                    mean_exit = (close[i] > bb_middle[i]) or (rsi[i] > self.rsi_overbought)
+                    stop_exit = stop_price is not None and close[i] <= stop_price
                     timeout_exit = self.max_bars_in_trade > 0 and bars_in_trade >= self.max_bars_in_trade
                     exit_now = mean_exit or stop_exit or timeout_exit
                 else:
-                    mean_exit = (row['close'] < row['bb_middle']) or (row['rsi'] < self.rsi_oversold)
-                    stop_exit = stop_price is not None and row['close'] >= stop_price
+                    mean_exit = (close[i] < bb_middle[i]) or (rsi[i] < self.rsi_oversold)
+                    stop_exit = stop_price is not None and close[i] >= stop_price
                     timeout_exit = self.max_bars_in_trade > 0 and bars_in_trade >= self.max_bars_in_trade
                     exit_now = mean_exit or stop_exit or timeout_exit
 
@@ -101,18 +109,18 @@ class MeanReversionStrategy(BaseStrategy):
                 bars_in_trade = 0
 
             if current_position == 0:
-                if bool(buy_condition.loc[idx]):
+                if buy[i]:
                     current_position = 1
-                    entry_price = float(row['close'])
-                    stop_price = self._get_stop_price(row, entry_price, side=1)
+                    entry_price = float(close[i])
+                    stop_price = self._get_stop_price(atr[i], entry_price, side=1)
                     bars_in_trade = 0
-                elif (not self.long_only) and bool(sell_condition.loc[idx]):
+                elif (not self.long_only) and sell[i]:
                     current_position = -1
-                    entry_price = float(row['close'])
-                    stop_price = self._get_stop_price(row, entry_price, side=-1)
+                    entry_price = float(close[i])
+                    stop_price = self._get_stop_price(atr[i], entry_price, side=-1)
                     bars_in_trade = 0
 
-            signals.append(current_position)
+            signals[i] = current_position
 
         df['signal'] = pd.Series(signals, index=df.index, dtype=int)
 
@@ -37,8 +37,8 @@ class PositionSizer:
         kelly_fraction = min(kelly_fraction, max_risk)
         position_size = kelly_fraction * equity
 
-        logger.debug(f"Kelly sizing: win_rate={win_rate:.2%}, kelly={kelly:.3f}, "
-                     f"safe_kelly={kelly_fraction:.3f}, position=${position_size:.2f}")
+        logger.debug("Kelly sizing: win_rate=%.2f%%, kelly=%.3f, safe_kelly=%.3f, position=$%.2f",
+                     win_rate * 100, kelly, kelly_fraction, position_size)
         return position_size
 
     def fixed_fractional(self, equity: float, risk_per_trade: float = 0.01) -> float:
@@ -46,8 +46,8 @@ class PositionSizer:
             logger.warning(f"risk_per_trade {risk_per_trade} out of range [0, 0.1], using 0.01")
             risk_per_trade = 0.01
         position_size = equity * risk_per_trade
-        logger.debug(f"Fixed fractional: equity=${equity:.2f}, risk={risk_per_trade:.2%}, "
-                     f"position=${position_size:.2f}")
+        logger.debug("Fixed fractional: equity=$%.2f, risk=%.2f%%, position=$%.2f",
+                     equity, risk_per_trade * 100, position_size)
         return position_size
 
     def volatility_based(self,
@@ -64,8 +64,8 @@ class PositionSizer:
         adjusted_risk = np.clip(adjusted_risk, base_risk * 0.5, base_risk * 2.0)
 
         position_size = equity * adjusted_risk
-        logger.debug(f"Volatility-based: vol={volatility:.3f}, target={target_volatility:.3f}, "
-                     f"adj_risk={adjusted_risk:.3%}, position=${position_size:.2f}")
+        logger.debug("Volatility-based: vol=%.3f, target=%.3f, adj_risk=%.3f%%, position=$%.2f",
+                     volatility, target_volatility, adjusted_risk * 100, position_size)
         return position_size
 
     @staticmethod
@@ -11,7 +11,7 @@ Modules:
 """
 
 from src.utils.logger import get_logger, setup_logging
-from src.utils.retry import retry_with_backoff
+from src.utils.retry import retry_with_backoff, retry_if, Retry
 from src.utils.rate_limiter import RateLimiter
 from src.utils.exceptions import *
 
@@ -19,5 +19,7 @@ __all__ = [
     'get_logger',
     'setup_logging',
     'retry_with_backoff',
+    'retry_if',
+    'Retry',
     'RateLimiter',
 ]
@@ -0,0 +1,26 @@
+"""
+Optional Numba JIT
+
+``njit`` compiles numeric kernels with Numba when it is installed and
+returns the plain Python function otherwise, so callers never need to
+branch on availability. ``prange`` falls back to ``range``.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -25,6 +25,11 @@ class RateLimitError(TradingBotError):
     pass
 
 
+class RetryExhaustedError(TradingBotError):
+    """Call still asked to be retried after the last attempt."""
+    pass
+
+
 class StorageError(TradingBotError):
     """Error writing/reading storage."""
     pass
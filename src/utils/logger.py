@@ -4,13 +4,48 @@ Logging Infrastructure
 Centralized logging setup with structured output and rotation.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import json
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+_LEVEL_MAP = {
+    'NOTSET': logging.NOTSET,
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARN': logging.WARNING,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'FATAL': logging.CRITICAL,
+    'CRITICAL': logging.CRITICAL,
+}
+
+_loggers: dict = {}
+
+
+if orjson is not None:
+    def _dumps(obj) -> str:
+        """Serialize with orjson, falling back to json for types it rejects."""
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            return json.dumps(obj)
+else:  # pragma: no cover - exercised only without orjson
+    _dumps = json.dumps
 
 
 class JSONFormatter(logging.Formatter):
@@ -18,6 +53,7 @@ class JSONFormatter(logging.Formatter):
     Format log records as JSON.
     
     Produces structured logs suitable for log aggregation systems.
+    Serializes with orjson when it is installed.
     """
     
     def format(self, record: logging.LogRecord) -> str:
@@ -32,15 +68,76 @@ class JSONFormatter(logging.Formatter):
             'line': record.lineno,
         }
         
-        # Add exception info if present
+        # Add exception info if present; cache the traceback text on the
+        # record so other handlers don't format it again
         if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data['exception'] = record.exc_text
         
         # Add extra fields
         if hasattr(record, 'extra'):
             log_data.update(record.extra)
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+_JSON_FORMAT_TEMPLATE = '''
+def format(self, record, _utc=datetime.utcfromtimestamp, _dumps=_dumps):
+    log_data = {{
+        'timestamp': _utc(record.created).isoformat() + 'Z',
+        'level': record.levelname,
+        'logger': record.name,
+        'message': record.getMessage(),
+        'module': record.module,
+        'function': record.funcName,
+        'line': record.lineno,
+    }}
+{exception_block}{extra_block}    return _dumps(log_data)
+'''
+
+_JSON_EXCEPTION_BLOCK = '''    if record.exc_info:
+        if not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        log_data['exception'] = record.exc_text
+'''
+
+_JSON_EXTRA_BLOCK = '''    if hasattr(record, 'extra'):
+        log_data.update(record.extra)
+'''
+
+
+def compile_json_formatter(
+    include_exception: bool = True,
+    include_extra: bool = True
+) -> JSONFormatter:
+    """
+    Build a JSONFormatter whose format() is specialized at setup time.
+    
+    The field list and the optional exception/extra handling are baked
+    into generated source, so each record skips the generic checks that
+    were disabled.
+    
+    Args:
+        include_exception: Emit formatted exception info when present
+        include_extra: Merge a record's ``extra`` dict into the output
+        
+    Returns:
+        Formatter instance with the specialized format method
+    """
+    source = _JSON_FORMAT_TEMPLATE.format(
+        exception_block=_JSON_EXCEPTION_BLOCK if include_exception else '',
+        extra_block=_JSON_EXTRA_BLOCK if include_extra else ''
+    )
+    namespace = {'datetime': datetime, '_dumps': _dumps}
+    exec(compile(source, '<compiled JSONFormatter>', 'exec'), namespace)
+    
+    formatter_cls = type(
+        'CompiledJSONFormatter',
+        (JSONFormatter,),
+        {'format': namespace['format']}
+    )
+    return formatter_cls()
 
 
 class TextFormatter(logging.Formatter):
@@ -55,13 +152,187 @@ class TextFormatter(logging.Formatter):
         )
 
 
+class AppendRotatingFileHandler(logging.Handler):
+    """
+    Size-rotating file handler that writes each record with one O_APPEND write.
+    
+    Skips the buffered io layer used by RotatingFileHandler. Rotation renames
+    the active file to ``.1`` (shifting older backups) and reopens it.
+    """
+    
+    terminator = '\n'
+    
+    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 0):
+        """
+        Initialize handler.
+        
+        Args:
+            filename: Path to log file
+            max_bytes: Rotate once the file would exceed this size (0 disables)
+            backup_count: Number of rotated files to keep (0 disables rotation)
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._fd: Optional[int] = self._open()
+        self._size = os.fstat(self._fd).st_size
+    
+    def _open(self) -> int:
+        return os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    def _should_rollover(self, n_bytes: int) -> bool:
+        if self.max_bytes <= 0 or self.backup_count <= 0:
+            return False
+        return self._size > 0 and self._size + n_bytes > self.max_bytes
+    
+    def _rollover(self) -> None:
+        os.close(self._fd)
+        try:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = f"{self.baseFilename}.{i}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.baseFilename}.{i + 1}")
+            os.replace(self.baseFilename, f"{self.baseFilename}.1")
+        finally:
+            # A failed rename must not leave a closed fd behind
+            self._fd = self._open()
+            self._size = os.fstat(self._fd).st_size
+    
+    def _write(self, chunks: List[bytes]) -> None:
+        """Append encoded records, rotating first if needed. Caller holds the lock."""
+        n_bytes = sum(len(chunk) for chunk in chunks)
+        if self._should_rollover(n_bytes):
+            self._rollover()
+        
+        written = os.writev(self._fd, chunks) if hasattr(os, 'writev') else 0
+        if written < n_bytes:
+            view = memoryview(b''.join(chunks))[written:]
+            while view:
+                view = view[os.write(self._fd, view):]
+        self._size += n_bytes
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the formatted record, rotating first if needed."""
+        try:
+            self._write([(self.format(record) + self.terminator).encode('utf-8')])
+        except Exception:
+            self.handleError(record)
+    
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write several records with a single vectored write."""
+        chunks = []
+        for record in records:
+            try:
+                chunks.append((self.format(record) + self.terminator).encode('utf-8'))
+            except Exception:
+                self.handleError(record)
+        if not chunks:
+            return
+        
+        self.acquire()
+        try:
+            self._write(chunks)
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        """Close the underlying file descriptor."""
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps exc_info so the file formatter can render it."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BatchingLogWriter:
+    """
+    Background writer that drains queued records in batches.
+    
+    Callers only pay for an enqueue; the writer thread hands up to
+    ``max_batch`` pending records to ``AppendRotatingFileHandler.emit_batch``
+    at a time, so a burst of records costs one write syscall.
+    
+    Example:
+        writer = BatchingLogWriter(AppendRotatingFileHandler('bot.log'))
+        writer.start()
+        logging.getLogger().addHandler(writer.queue_handler())
+    """
+    
+    def __init__(self, handler: AppendRotatingFileHandler, max_batch: int = 256):
+        """
+        Initialize writer.
+        
+        Args:
+            handler: Handler that performs the batched writes
+            max_batch: Maximum records per write (kept below IOV_MAX)
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+    
+    def queue_handler(self) -> logging.handlers.QueueHandler:
+        """Return a handler that enqueues records for this writer."""
+        return _InProcessQueueHandler(self.queue)
+    
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Flush pending records, stop the thread and close the handler."""
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self.handler.close()
+    
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            records = [record for record in batch if record is not None]
+            if records:
+                self.handler.emit_batch(records)
+            if len(records) != len(batch):
+                return
+
+
+_log_writer: Optional[BatchingLogWriter] = None
+
+
 def setup_logging(
     level: str = 'INFO',
     log_file: Optional[str] = None,
     max_bytes: int = 10_485_760,
     backup_count: int = 5,
     format_type: str = 'json',
-    console: bool = True
+    console: bool = True,
+    json_exceptions: bool = True,
+    json_extra: bool = True,
+    async_file: bool = False
 ) -> None:
     """
     Set up application-wide logging.
@@ -73,17 +344,28 @@ def setup_logging(
         backup_count: Number of backup files to keep
         format_type: 'json' or 'text'
         console: Whether to log to console
+        json_exceptions: Include exception info in JSON output
+        json_extra: Include a record's ``extra`` dict in JSON output
+        async_file: Write JSON file logs from a background batching thread
     """
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper()))
+    level_name = level.upper()
+    if level_name not in _LEVEL_MAP:
+        raise ValueError(f"Invalid log level: {level}. Must be one of {list(_LEVEL_MAP)}")
+    root_logger.setLevel(_LEVEL_MAP[level_name])
     
     # Remove existing handlers
+    global _log_writer
     root_logger.handlers = []
+    if _log_writer is not None:
+        atexit.unregister(_log_writer.stop)
+        _log_writer.stop()
+        _log_writer = None
     
     # Choose formatter
     if format_type == 'json':
-        formatter = JSONFormatter()
+        formatter = compile_json_formatter(json_exceptions, json_extra)
     else:
         formatter = TextFormatter()
     
@@ -99,13 +381,27 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count
-        )
+        if format_type == 'json':
+            file_handler = AppendRotatingFileHandler(
+                log_file,
+                max_bytes=max_bytes,
+                backup_count=backup_count
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count
+            )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        if async_file and format_type == 'json':
+            _log_writer = BatchingLogWriter(file_handler)
+            _log_writer.start()
+            atexit.register(_log_writer.stop)
+            root_logger.addHandler(_log_writer.queue_handler())
+        else:
+            root_logger.addHandler(file_handler)
     
     # Log the setup
     logger = logging.getLogger(__name__)
@@ -116,13 +412,19 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance.
     
+    Resolved loggers are cached so repeat lookups skip the logging
+    module's global lock.
+    
     Args:
         name: Logger name (typically __name__)
         
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = logging.getLogger(name)
+    return logger
 
 
 def log_with_context(logger: logging.Logger, level: str, message: str, **kwargs):
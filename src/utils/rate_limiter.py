@@ -4,102 +4,195 @@ Rate Limiter
 Token bucket rate limiter for API calls.
 """
 
+import math
 import time
 from typing import Optional
 from collections import deque
-from threading import Lock
+from threading import Condition, Lock
 import logging
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_MINUTE = 60 * _NS_PER_SECOND
+
+
+class _Waiter:
+    """Queue entry for a blocked acquire; compared by identity."""
+    
+    __slots__ = ('tokens',)
+    
+    def __init__(self, tokens: int):
+        self.tokens = tokens
+
 
 class RateLimiter:
     """
     Token bucket rate limiter.
     
-    Allows bursts up to burst_size, then enforces calls_per_minute rate.
+    Allows bursts up to the bucket capacity, then enforces the sustained
+    refill rate. The rate can be given as calls_per_minute or as
+    rate_per_period calls every period seconds.
     
     Thread-safe implementation.
     
     Example:
         limiter = RateLimiter(calls_per_minute=60, burst_size=10)
+        limiter = RateLimiter(rate_per_period=10, period=1.0, burst=20, initial_tokens=0)
         
         limiter.acquire()  # May block if rate limit exceeded
         response = api.call()
     """
     
-    def __init__(self, calls_per_minute: int, burst_size: Optional[int] = None):
+    def __init__(self, calls_per_minute: Optional[float] = None,
+                 burst_size: Optional[int] = None, *,
+                 rate_per_period: Optional[float] = None,
+                 period: float = 60.0,
+                 burst: Optional[int] = None,
+                 initial_tokens: Optional[float] = None):
         """
         Initialize rate limiter.
         
         Args:
-            calls_per_minute: Maximum calls per minute
-            burst_size: Maximum burst allowance (default: same as calls_per_minute)
+            calls_per_minute: Maximum sustained calls per minute
+            burst_size: Maximum burst allowance (default: one period of calls)
+            rate_per_period: Sustained calls per period (alternative to calls_per_minute)
+            period: Length of the rate period in seconds (default: 60)
+            burst: Bucket capacity; takes precedence over burst_size
+            initial_tokens: Tokens available at start (default: full bucket)
         """
-        if calls_per_minute <= 0:
-            raise ValueError("calls_per_minute must be positive")
+        if (calls_per_minute is None) == (rate_per_period is None):
+            raise ValueError("Specify exactly one of calls_per_minute or rate_per_period")
+        if calls_per_minute is not None:
+            rate_per_period, period = calls_per_minute, 60.0
+        if rate_per_period <= 0 or period <= 0:
+            raise ValueError("rate_per_period and period must be positive")
         
-        self.calls_per_minute = calls_per_minute
-        self.burst_size = burst_size if burst_size is not None else calls_per_minute
-        self.tokens = float(self.burst_size)
-        self.last_update = time.time()
+        if burst is None:
+            burst = burst_size
+        if burst is None:
+            burst = rate_per_period
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if initial_tokens is not None and initial_tokens < 0:
+            raise ValueError("initial_tokens must be non-negative")
+        
+        self.refill_rate = rate_per_period / period  # tokens per second
+        self.calls_per_minute = calls_per_minute if calls_per_minute is not None else self.refill_rate * 60
+        self.capacity = burst
+        self.burst_size = burst
+        self.tokens = float(burst if initial_tokens is None else min(initial_tokens, burst))
+        self.last_update = time.monotonic_ns()
+        self._tokens_per_ns = self.refill_rate / _NS_PER_SECOND
         self.lock = Lock()
-        self.call_times = deque(maxlen=calls_per_minute)
+        self._cv = Condition(self.lock)
+        self._waiters = deque()
+        self.call_times = deque(maxlen=max(1, math.ceil(self.calls_per_minute)))
         
-        logger.debug(
-            "Rate limiter initialized",
-            extra={
-                'calls_per_minute': calls_per_minute,
-                'burst_size': self.burst_size
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Rate limiter initialized",
+                extra={
+                    'refill_rate': self.refill_rate,
+                    'capacity': self.capacity
+                }
+            )
     
-    def acquire(self, blocking: bool = True) -> bool:
+    def acquire(self, tokens: int = 1, blocking: bool = True) -> bool:
         """
-        Acquire permission to make a call.
+        Acquire permission to make a call (or a batch of calls).
         
         Args:
+            tokens: Number of tokens to take under a single lock acquisition
             blocking: If True, block until token available. If False, return immediately.
             
         Returns:
             True if acquired, False if not available (only when blocking=False)
         """
-        with self.lock:
-            now = time.time()
-            
-            # Refill tokens based on time passed
-            time_passed = now - self.last_update
-            new_tokens = time_passed * self.calls_per_minute / 60.0
-            self.tokens = min(self.burst_size, self.tokens + new_tokens)
-            self.last_update = now
-            
-            # Check if we have tokens
-            if self.tokens >= 1:
-                self.tokens -= 1
-                self.call_times.append(now)
+        self._check_cost(tokens)
+        
+        with self._cv:
+            # Tokens already promised to queued waiters are not up for grabs
+            if self._take_token(time.monotonic_ns(), self._reserved(), tokens):
                 return True
             
             # No tokens available
             if not blocking:
                 return False
             
-            # Calculate wait time
-            wait_time = (1 - self.tokens) * 60.0 / self.calls_per_minute
-            
-            logger.debug(
-                f"Rate limit hit, waiting {wait_time:.2f}s",
-                extra={'wait_time': wait_time, 'tokens': self.tokens}
-            )
+            # Queue up and sleep until this caller's tokens have refilled. Each
+            # waiter times its wait by what is queued ahead of it, so one refill
+            # wakes one waiter instead of all of them; reset() notifies everyone.
+            waiter = _Waiter(tokens)
+            self._waiters.append(waiter)
+            try:
+                while True:
+                    ahead = self._reserved(waiter)
+                    if self._take_token(time.monotonic_ns(), ahead, tokens):
+                        return True
+                    
+                    wait_time = (ahead + tokens - self.tokens) / self.refill_rate
+                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Rate limit hit, waiting %.2fs", wait_time,
+                            extra={'wait_time': wait_time, 'tokens': self.tokens, 'queued': ahead}
+                        )
+                    
+                    self._cv.wait(wait_time)
+            finally:
+                self._waiters.remove(waiter)
+    
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """
+        Non-blocking fast path: take tokens if they are available.
         
-        # Sleep outside the lock
-        time.sleep(wait_time)
+        Args:
+            tokens: Number of tokens to take
+            
+        Returns:
+            True if acquired, False otherwise
+        """
+        self._check_cost(tokens)
         
-        # Try again after sleeping
         with self.lock:
-            self.tokens = 0  # Already waited for full second refill
-            self.last_update = time.time()
-            self.call_times.append(self.last_update)
+            return self._take_token(time.monotonic_ns(), self._reserved(), tokens)
+    
+    def _check_cost(self, tokens: int) -> None:
+        """Reject requests the bucket can never satisfy."""
+        if not 1 <= tokens <= self.capacity:
+            raise ValueError(f"tokens must be between 1 and capacity ({self.capacity}), got {tokens}")
+    
+    def _reserved(self, until: Optional['_Waiter'] = None) -> int:
+        """Tokens owed to queued waiters (ahead of ``until`` if given). Caller holds the lock."""
+        reserved = 0
+        for waiter in self._waiters:
+            if waiter is until:
+                break
+            reserved += waiter.tokens
+        return reserved
+    
+    def _take_token(self, now: int, reserved: int = 0, cost: int = 1) -> bool:
+        """
+        Refill from elapsed time and take ``cost`` tokens, leaving ``reserved``
+        tokens for callers queued ahead. Caller holds the lock.
+        """
+        tokens = min(
+            self.capacity,
+            self.tokens + (now - self.last_update) * self._tokens_per_ns
+        )
+        self.last_update = now
+        
+        if tokens >= cost + reserved:
+            self.tokens = tokens - cost
+            if cost == 1:
+                self.call_times.append(now)
+            else:
+                self.call_times.extend((now,) * cost)
             return True
+        
+        self.tokens = tokens
+        return False
     
     def get_stats(self) -> dict:
         """
@@ -109,23 +202,29 @@ class RateLimiter:
             Dictionary with stats
         """
         with self.lock:
-            now = time.time()
+            now = time.monotonic_ns()
             
-            # Calculate current rate (calls in last 60 seconds)
-            recent_calls = [t for t in self.call_times if now - t <= 60]
-            current_rate = len(recent_calls)
+            # Calculate current rate (calls in last 60 seconds); call_times is
+            # time-ordered, so expired entries are drained from the left
+            call_times = self.call_times
+            while call_times and now - call_times[0] > _NS_PER_MINUTE:
+                call_times.popleft()
+            current_rate = len(call_times)
             
             return {
                 'tokens': self.tokens,
+                'capacity': self.capacity,
+                'refill_rate': self.refill_rate,
                 'calls_per_minute_limit': self.calls_per_minute,
                 'current_rate': current_rate,
-                'utilization': current_rate / self.calls_per_minute if self.calls_per_minute > 0 else 0
+                'utilization': current_rate / self.calls_per_minute
             }
     
     def reset(self):
-        """Reset the rate limiter (refill all tokens)."""
-        with self.lock:
-            self.tokens = float(self.burst_size)
-            self.last_update = time.time()
+        """Reset the rate limiter (refill all tokens and wake blocked callers)."""
+        with self._cv:
+            self.tokens = float(self.capacity)
+            self.last_update = time.monotonic_ns()
             self.call_times.clear()
+            self._cv.notify_all()
             logger.info("Rate limiter reset")
@@ -10,10 +10,124 @@ from typing import Callable, Type, Tuple, TypeVar, Optional
 import logging
 from functools import wraps
 
+from src.utils.exceptions import RetryExhaustedError
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+_NS_PER_SECOND = 1_000_000_000
+_JITTER_BITS = 20
+
+
+def _backoff_schedule(
+    max_attempts: int,
+    base_delay: float,
+    max_delay: float
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Precompute the backoff delays and jitter caps for each retry, in ns.
+    
+    Entry ``i`` applies after failed attempt ``i + 1``.
+    
+    Returns:
+        Tuple of (delays, jitter caps)
+    """
+    base_ns = int(base_delay * _NS_PER_SECOND)
+    max_ns = int(max_delay * _NS_PER_SECOND)
+    delays = tuple(
+        min(base_ns << (attempt - 1), max_ns)
+        for attempt in range(1, max_attempts)
+    )
+    jitters = tuple(delay // 10 for delay in delays)
+    return delays, jitters
+
+
+def _backoff_seconds(delay_ns: int, jitter_ns: int) -> float:
+    """Delay plus uniform jitter in [0, jitter_ns), as seconds."""
+    jitter = (random.getrandbits(_JITTER_BITS) * jitter_ns) >> _JITTER_BITS
+    return (delay_ns + jitter) / _NS_PER_SECOND
+
+
+class Retry:
+    """
+    Sentinel a ``retry_if`` function returns to ask for another attempt.
+    
+    Cheaper than raising for expected transient outcomes (e.g. HTTP 429),
+    since no traceback is built.
+    
+    Args:
+        delay: Seconds to wait instead of the scheduled backoff
+        reason: Short description for logging
+    """
+    
+    __slots__ = ('delay', 'reason')
+    
+    def __init__(self, delay: Optional[float] = None, reason: str = ''):
+        self.delay = delay
+        self.reason = reason
+    
+    def __repr__(self) -> str:
+        return f"Retry(delay={self.delay!r}, reason={self.reason!r})"
+
+
+def _retry_failed_call(
+    func: Callable[..., T],
+    args: tuple,
+    kwargs: dict,
+    error: Exception,
+    exceptions: Tuple[Type[Exception], ...],
+    delays: Tuple[int, ...],
+    jitters: Tuple[int, ...],
+    on_retry: Optional[Callable] = None
+) -> T:
+    """
+    Slow path after a failed first call: back off and retry per the schedule.
+    
+    Re-raises the last error once the schedule is exhausted.
+    """
+    max_attempts = len(delays) + 1
+    name = getattr(func, '__name__', repr(func))
+    
+    for attempt, (delay_ns, jitter_ns) in enumerate(zip(delays, jitters), 1):
+        sleep_time = _backoff_seconds(delay_ns, jitter_ns)
+        
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Retry %d/%d for %s after %.2fs",
+                attempt, max_attempts, name, sleep_time,
+                extra={
+                    'function': name,
+                    'attempt': attempt,
+                    'max_attempts': max_attempts,
+                    'delay': sleep_time,
+                    'error': str(error),
+                    'error_type': type(error).__name__
+                }
+            )
+        
+        # Call retry callback if provided
+        if on_retry:
+            on_retry(attempt, error)
+        
+        time.sleep(sleep_time)
+        
+        try:
+            return func(*args, **kwargs)
+        except exceptions as e:
+            error = e
+    
+    logger.error(
+        "Max retries (%d) exhausted for %s", max_attempts, name,
+        extra={
+            'function': name,
+            'attempt': max_attempts,
+            'error': str(error),
+            'error_type': type(error).__name__
+        }
+    )
+    raise error
+
 
 def retry_with_backoff(
     max_attempts: int = 3,
@@ -41,49 +155,100 @@ def retry_with_backoff(
             return api.get_data()
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        delays, jitters = _backoff_schedule(max_attempts, base_delay, max_delay)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            # Fast path: a successful first call costs one try block
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                error = e
+            return _retry_failed_call(
+                func, args, kwargs, error, exceptions, delays, jitters, on_retry
+            )
+        
+        return wrapper
+    return decorator
+
+
+def retry_if(
+    predicate: Optional[Callable[[object], bool]] = None,
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    on_retry: Optional[Callable] = None
+):
+    """
+    Decorator retrying on return values rather than exceptions.
+    
+    The wrapped function returns a ``Retry`` to ask for another attempt,
+    or ``predicate(result)`` flags the result as retryable. Exceptions
+    propagate untouched. Delays follow the same schedule as
+    ``retry_with_backoff`` unless ``Retry.delay`` overrides them.
+    
+    Args:
+        predicate: Optional check on non-``Retry`` results
+        max_attempts: Maximum attempts
+        base_delay: Initial delay in seconds
+        max_delay: Maximum delay cap
+        on_retry: Optional callback called before each retry
+        
+    Returns:
+        Decorated function
+        
+    Raises:
+        RetryExhaustedError: If the last attempt still asks to retry
+        
+    Example:
+        @retry_if(max_attempts=5)
+        def fetch_data():
+            response = api.get_data()
+            if response.status == 429:
+                return Retry(delay=response.retry_after)
+            return response
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        delays, jitters = _backoff_schedule(max_attempts, base_delay, max_delay)
+        name = getattr(func, '__name__', repr(func))
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    if attempt == max_attempts:
-                        logger.error(
-                            f"Max retries ({max_attempts}) exhausted for {func.__name__}",
-                            extra={
-                                'function': func.__name__,
-                                'attempt': attempt,
-                                'error': str(e),
-                                'error_type': type(e).__name__
-                            }
-                        )
-                        raise
-                    
-                    # Calculate backoff with jitter
-                    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
-                    jitter = random.uniform(0, delay * 0.1)
-                    sleep_time = delay + jitter
-                    
+            result = func(*args, **kwargs)
+            
+            for attempt, (delay_ns, jitter_ns) in enumerate(zip(delays, jitters), 1):
+                if isinstance(result, Retry):
+                    delay = result.delay
+                elif predicate is not None and predicate(result):
+                    delay = None
+                else:
+                    return result
+                
+                sleep_time = _backoff_seconds(delay_ns, jitter_ns) if delay is None else delay
+                if logger.isEnabledFor(logging.WARNING):
                     logger.warning(
-                        f"Retry {attempt}/{max_attempts} for {func.__name__} after {sleep_time:.2f}s",
+                        "Retry %d/%d for %s after %.2fs",
+                        attempt, max_attempts, name, sleep_time,
                         extra={
-                            'function': func.__name__,
+                            'function': name,
                             'attempt': attempt,
                             'max_attempts': max_attempts,
                             'delay': sleep_time,
-                            'error': str(e),
-                            'error_type': type(e).__name__
+                            'result': repr(result)
                         }
                     )
-                    
-                    # Call retry callback if provided
-                    if on_retry:
-                        on_retry(attempt, e)
-                    
-                    time.sleep(sleep_time)
+                
+                if on_retry:
+                    on_retry(attempt, result)
+                
+                time.sleep(sleep_time)
+                result = func(*args, **kwargs)
             
-            # This should never be reached, but makes type checker happy
-            raise RuntimeError("Retry logic error")
+            if isinstance(result, Retry) or (predicate is not None and predicate(result)):
+                raise RetryExhaustedError(
+                    f"Max retries ({max_attempts}) exhausted for {name}: {result!r}"
+                )
+            return result
         
         return wrapper
     return decorator
@@ -111,6 +276,7 @@ class RetryContext:
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exceptions = exceptions
+        self._delays, self._jitters = _backoff_schedule(max_attempts, base_delay, max_delay)
     
     def execute(self, func: Callable[..., T], *args, **kwargs) -> T:
         """
@@ -124,26 +290,10 @@ class RetryContext:
         Returns:
             Function result
         """
-        for attempt in range(1, self.max_attempts + 1):
-            try:
-                return func(*args, **kwargs)
-            except self.exceptions as e:
-                if attempt == self.max_attempts:
-                    logger.error(
-                        f"Max retries ({self.max_attempts}) exhausted",
-                        extra={'attempt': attempt, 'error': str(e)}
-                    )
-                    raise
-                
-                delay = min(self.base_delay * (2 ** (attempt - 1)), self.max_delay)
-                jitter = random.uniform(0, delay * 0.1)
-                sleep_time = delay + jitter
-                
-                logger.warning(
-                    f"Retry {attempt}/{self.max_attempts} after {sleep_time:.2f}s",
-                    extra={'attempt': attempt, 'delay': sleep_time, 'error': str(e)}
-                )
-                
-                time.sleep(sleep_time)
-        
-        raise RuntimeError("Retry logic error")
+        try:
+            return func(*args, **kwargs)
+        except self.exceptions as e:
+            error = e
+        return _retry_failed_call(
+            func, args, kwargs, error, self.exceptions, self._delays, self._jitters
+        )
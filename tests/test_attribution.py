@@ -7,6 +7,7 @@ Tests for P&L breakdown and attribution analysis.
 
 import pytest
 import pandas as pd
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from src.backtest.attribution import AttributionAnalyzer, Trade
 
@@ -57,6 +58,11 @@ def create_sample_trades():
     return trades
 
 
+def create_sample_trades_frame():
+    """Sample trades as a column-oriented DataFrame for the bulk path."""
+    return pd.DataFrame([asdict(t) for t in create_sample_trades()])
+
+
 class TestTrade:
     """Test Trade dataclass."""
     
@@ -222,6 +228,58 @@ class TestAttributionAnalyzer:
         assert 'COST BREAKDOWN' in report
         assert 'TOP SYMBOLS' in report
 
+    
+    def test_bulk_trades_match_scalar_trades(self):
+        """Test bulk-loaded trades produce the same attribution."""
+        scalar = AttributionAnalyzer()
+        for trade in create_sample_trades():
+            scalar.add_trade(trade)
+        
+        bulk = AttributionAnalyzer()
+        bulk.add_trades_bulk(create_sample_trades_frame())
+        
+        pd.testing.assert_frame_equal(
+            bulk.analyze_by_symbol().reset_index(drop=True),
+            scalar.analyze_by_symbol().reset_index(drop=True)
+        )
+        assert bulk.analyze_by_direction() == scalar.analyze_by_direction()
+        assert bulk.analyze_costs() == scalar.analyze_costs()
+    
+    def test_bulk_trades_without_exit_are_open(self):
+        """Test bulk rows without exit columns count as open trades."""
+        analyzer = AttributionAnalyzer()
+        analyzer.add_trades_bulk(
+            create_sample_trades_frame().drop(columns=['exit_price', 'exit_timestamp'])
+        )
+        
+        summary = analyzer.get_summary()
+        assert summary['num_trades'] == 0
+    
+    def test_bulk_trades_missing_columns(self):
+        """Test bulk path rejects frames without required columns."""
+        analyzer = AttributionAnalyzer()
+        
+        with pytest.raises(ValueError):
+            analyzer.add_trades_bulk(pd.DataFrame({'symbol': ['BTC/USD']}))
+    
+    def test_trade_closed_after_add_is_analyzed(self):
+        """Test closing a trade after add_trade is seen by later analysis."""
+        analyzer = AttributionAnalyzer()
+        trade = Trade(
+            timestamp=datetime(2024, 1, 1),
+            symbol='BTC/USD',
+            side='BUY',
+            quantity=1.0,
+            entry_price=100
+        )
+        analyzer.add_trade(trade)
+        assert analyzer.get_summary()['num_trades'] == 0
+        
+        trade.exit_price = 110
+        trade.exit_timestamp = datetime(2024, 1, 1, 1)
+        
+        assert analyzer.get_summary()['total_pnl'] == 10.0
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
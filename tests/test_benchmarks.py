@@ -0,0 +1,79 @@
+"""
+Pipeline Benchmarks
+
+Times each rung of the integration pipeline (price features, technical
+indicators, backtest) independently with pytest-benchmark.
+
+Save a baseline and fail on regressions with:
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from src.config import load_config
+from src.features.price_features import PriceFeatures
+from src.features.technical_indicators import TechnicalIndicators
+from src.strategies.mean_reversion import MeanReversionStrategy
+from src.backtest.engine import Backtester
+from tests.test_full_integration import create_realistic_market_data
+
+
+pytestmark = pytest.mark.performance
+
+
+@pytest.fixture(scope="module")
+def market_data():
+    """One day of 1-minute bars."""
+    return create_realistic_market_data(days=1)
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Dev configuration shared by the strategy and backtester."""
+    return load_config('dev')
+
+
+@pytest.fixture(scope="module")
+def strategy(config):
+    """Mean reversion strategy with the configured parameters."""
+    mean_reversion = config.strategy.mean_reversion
+    return MeanReversionStrategy({
+        'rsi_window': mean_reversion.rsi_window,
+        'rsi_oversold': mean_reversion.rsi_oversold,
+        'rsi_overbought': mean_reversion.rsi_overbought,
+        'bollinger_window': mean_reversion.bollinger_window,
+        'bollinger_std': mean_reversion.bollinger_std
+    })
+
+
+def test_bench_price_features(benchmark, market_data):
+    """Benchmark PriceFeatures.compute."""
+    price_features = PriceFeatures(validate_lookahead=False)
+    df = benchmark(price_features.compute, market_data)
+    assert len(df) == len(market_data)
+
+
+def test_bench_technical_indicators(benchmark, market_data):
+    """Benchmark TechnicalIndicators.compute."""
+    indicators = TechnicalIndicators(validate_lookahead=False)
+    df = benchmark(indicators.compute, market_data)
+    assert 'rsi' in df.columns
+
+
+def test_bench_backtest(benchmark, market_data, config, strategy):
+    """Benchmark Backtester.run on feature-ready data."""
+    df = PriceFeatures(validate_lookahead=False).compute(market_data)
+    df = TechnicalIndicators(validate_lookahead=False).compute(df)
+    backtester = Backtester(
+        initial_capital=config.backtest.initial_capital,
+        commission_pct=config.backtest.commission_pct,
+        slippage_pct=config.backtest.slippage_pct
+    )
+
+    # run() adds columns to its input, so each round gets a fresh copy
+    results, metrics = benchmark(lambda: backtester.run(strategy, df.copy()))
+    assert metrics['total_trades'] >= 0
@@ -52,6 +52,23 @@ def test_load_config():
     assert config.risk.limits.max_position_size == 0.03  # More conservative
 
 
+def test_load_config_reuses_parsed_yaml():
+    """Test repeated loads skip the YAML parse but return fresh objects."""
+    from src.config.settings import _read_config_files
+    _read_config_files.cache_clear()
+    
+    config = load_config('dev')
+    config2 = load_config('dev')
+    
+    assert _read_config_files.cache_info().hits == 1
+    assert config is not config2
+    assert config == config2
+    
+    # Mutating one instance must not leak into later loads
+    config.risk.limits.max_position_size = 0.01
+    assert load_config('dev') == config2
+
+
 def test_deep_merge():
     """Test deep merge function."""
     base = {'a': 1, 'b': {'c': 2, 'd': 3}}
@@ -0,0 +1,78 @@
+"""
+Core Data Pipeline Tests
+
+The verify_pipeline stages as independent tests, so each failure is
+reported on its own and the cases can be spread across xdist workers
+(pytest -n auto).
+"""
+
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.data.ingest.validator import DataValidator
+from src.data.storage.data_lake import DataLake
+from tests.verify_pipeline import (
+    _gap_stage,
+    _kept_rows,
+    _outlier_stage,
+    _staleness_stage,
+    create_mock_data,
+)
+
+
+@pytest.fixture(scope="session")
+def window_end():
+    """End of the mock window; fixed for the session."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def mock_df(window_end):
+    """Two hours of 1-minute mock bars; columns are shared and read-only."""
+    return create_mock_data(window_end - timedelta(hours=2), window_end)
+
+
+def test_validation(mock_df):
+    """Test fresh, well-formed mock data passes validation."""
+    validator = DataValidator()
+
+    assert validator.compile_for(mock_df.dtypes.to_dict())(mock_df)
+
+
+def test_storage_roundtrip(mock_df, tmp_path):
+    """Test every saved row is present in the Parquet footers."""
+    data_lake = DataLake(str(tmp_path))
+    data_lake.get_raw_store().save(mock_df, "TEST_BTC_USDT", "1m")
+
+    partitions = (data_lake.raw_dir / "TEST_BTC_USDT" / "1m").rglob("*.parquet")
+    assert sum(pq.read_metadata(path).num_rows for path in partitions) == len(mock_df)
+
+
+def test_gap_detection(mock_df):
+    """Test dropping bars 10-19 yields exactly the gap between bars 9 and 20."""
+    df_gap = mock_df.take(_kept_rows(len(mock_df), 10, 20))
+    timestamps = mock_df['timestamp']
+
+    assert _gap_stage(df_gap, 1) == {(timestamps.iat[9], timestamps.iat[20])}
+
+
+@pytest.mark.parametrize("hours_later, stale", [(0, False), (5, True)])
+def test_staleness(mock_df, window_end, hours_later, stale):
+    """Test age is measured from the last bar to the reference clock."""
+    age = _staleness_stage(mock_df, 15, window_end + timedelta(hours=hours_later))
+
+    assert age == pytest.approx(hours_later * 60)
+    assert (age > 15) == stale
+
+
+def test_outliers(mock_df):
+    """Test a single 50% spike is the only flagged row."""
+    close = mock_df['close'].to_numpy(copy=True)
+    close[50] *= 1.5
+    outlier_df = pd.DataFrame({'close': close}, index=mock_df.index, copy=False)
+
+    assert _outlier_stage(outlier_df, 3.0, 20) == (50,)
@@ -7,14 +7,14 @@ Tests for price features, technical indicators, and lookahead bias detection.
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 
 from src.features.price_features import PriceFeatures
 from src.features.technical_indicators import TechnicalIndicators
+from src.features.base_feature import feature_columns
 from src.features.validation.lookahead_detector import LookaheadDetector
 
 
-def create_mock_ohlcv(n_rows=100, start_price=100, volatility=0.02):
+def create_mock_ohlcv(n_rows=100, start_price=100, volatility=0.02, rng=None):
     """
     Create mock OHLCV data for testing.
     
@@ -22,51 +22,92 @@ def create_mock_ohlcv(n_rows=100, start_price=100, volatility=0.02):
         n_rows: Number of rows to generate
         start_price: Starting price
         volatility: Price volatility (std dev of returns)
+        rng: NumPy Generator to draw from (default: seeded with 42)
         
     Returns:
         DataFrame with OHLCV data
     """
-    np.random.seed(42)
+    if rng is None:
+        rng = np.random.default_rng(42)
     
     # Generate timestamps
-    start_time = datetime(2024, 1, 1)
-    timestamps = [start_time + timedelta(minutes=i) for i in range(n_rows)]
+    timestamps = pd.date_range('2024-01-01', periods=n_rows, freq='1min')
     
     # Generate price series (random walk with drift)
-    returns = np.random.normal(0.0001, volatility, n_rows)
+    returns = rng.standard_normal(n_rows)
+    returns *= volatility
+    returns += 0.0001
     prices = start_price * np.cumprod(1 + returns)
     
-    # Generate OHLC from close prices
-    data = []
-    for i, (ts, close) in enumerate(zip(timestamps, prices)):
-        # Random high/low around close
-        high = close * (1 + abs(np.random.normal(0, volatility/2)))
-        low = close * (1 - abs(np.random.normal(0, volatility/2)))
-        open_price = prices[i-1] if i > 0 else close
-        volume = np.random.uniform(1000000, 5000000)
-        
-        data.append({
-            'timestamp': ts,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
+    # Generate OHLC from close prices (half-normal high/low offsets around close)
+    noise = rng.standard_normal((2, n_rows))
+    noise *= volatility/2
+    np.abs(noise, out=noise)
+    volume = rng.uniform(1000000, 5000000, n_rows)
     
-    df = pd.DataFrame(data)
+    high = prices * (1 + noise[0])
+    low = prices * (1 - noise[1])
+    open_ = np.empty(n_rows)
+    open_[0] = prices[0]
+    open_[1:] = prices[:-1]
+    
+    df = pd.DataFrame({
+        'timestamp': timestamps,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': prices,
+        'volume': volume
+    }, copy=False)
     return df
 
 
+@pytest.fixture(scope="session")
+def price_features():
+    """Shared PriceFeatures; compute methods copy their input and keep no state."""
+    return PriceFeatures(validate_lookahead=False)
+
+
+@pytest.fixture(scope="session")
+def technical_indicators():
+    """Shared TechnicalIndicators; compute methods copy their input and keep no state."""
+    return TechnicalIndicators(validate_lookahead=False)
+
+
+@pytest.fixture(scope="session")
+def mock_ohlcv_200():
+    """Shared 200-row frame; copy before mutating."""
+    return create_mock_ohlcv(200)
+
+
+@pytest.fixture(scope="session")
+def mock_ohlcv_500():
+    """Shared 500-row frame; copy before mutating."""
+    return create_mock_ohlcv(500)
+
+
+@pytest.fixture(scope="session")
+def mock_ohlcv_1000():
+    """Shared 1000-row frame; copy before mutating."""
+    return create_mock_ohlcv(1000)
+
+
+@pytest.fixture(scope="session")
+def df_with_all_indicators(mock_ohlcv_1000, technical_indicators):
+    """Shared 1000-row frame with RSI, MACD and Bollinger Bands added once."""
+    df = technical_indicators.add_rsi(mock_ohlcv_1000, window=14)
+    df = technical_indicators.add_macd(df, fast=12, slow=26, signal=9)
+    return technical_indicators.add_bollinger_bands(df, window=20, std=2)
+
+
 class TestPriceFeatures:
     """Tests for PriceFeatures class."""
     
-    def test_compute_returns(self):
+    def test_compute_returns(self, mock_ohlcv_200, price_features):
         """Test return calculation is correct."""
-        df = create_mock_ohlcv(200)
-        features = PriceFeatures(validate_lookahead=False)
+        df = mock_ohlcv_200
         
-        df, cols = features.compute_returns(df, horizons=[5, 15])
+        df, cols = price_features.compute_returns(df, horizons=[5, 15])
         
         # Check columns created
         assert 'target_return_5min' in df.columns
@@ -76,18 +117,17 @@ class TestPriceFeatures:
         
         # Verify calculation is correct for target returns
         expected_5 = df['close'].pct_change(5).shift(-5)
-        assert np.allclose(df['target_return_5min'], expected_5, equal_nan=True)
+        pd.testing.assert_series_equal(df['target_return_5min'], expected_5, check_names=False, rtol=1e-12)
         
         # Verify calculation is correct for lagged returns
         expected_lag = df['close'].pct_change(5)
-        assert np.allclose(df['return_5min_lag'], expected_lag, equal_nan=True)
+        pd.testing.assert_series_equal(df['return_5min_lag'], expected_lag, check_names=False, rtol=1e-12)
     
-    def test_compute_volatility(self):
+    def test_compute_volatility(self, mock_ohlcv_200, price_features):
         """Test volatility calculation."""
-        df = create_mock_ohlcv(200)
-        features = PriceFeatures(validate_lookahead=False)
+        df = mock_ohlcv_200
         
-        df, cols = features.compute_volatility(df, windows=[20])
+        df, cols = price_features.compute_volatility(df, windows=[20])
         
         # Check columns created
         assert 'volatility_20' in df.columns
@@ -99,12 +139,11 @@ class TestPriceFeatures:
         # Should have NaN for first window-1 rows
         assert df['volatility_20'].iloc[:19].isna().all()
     
-    def test_compute_price_ratios(self):
+    def test_compute_price_ratios(self, price_features):
         """Test price ratio features."""
         df = create_mock_ohlcv(250)
-        features = PriceFeatures(validate_lookahead=False)
         
-        df, cols = features.compute_price_ratios(df)
+        df, cols = price_features.compute_price_ratios(df)
         
         # Check columns created
         assert 'price_to_sma20' in df.columns
@@ -115,12 +154,11 @@ class TestPriceFeatures:
         ratios = df['price_to_sma20'].dropna()
         assert ratios.mean() > 0.9 and ratios.mean() < 1.1
     
-    def test_no_lookahead_in_lag_features(self):
+    def test_no_lookahead_in_lag_features(self, mock_ohlcv_1000, price_features):
         """Test that lagged features don't have lookahead bias."""
-        df = create_mock_ohlcv(1000)
-        features = PriceFeatures(validate_lookahead=False)
+        df = mock_ohlcv_1000
         
-        df, cols = features.compute_returns(df, horizons=[5])
+        df, cols = price_features.compute_returns(df, horizons=[5])
         
         # Only check lagged feature (not target)
         detector = LookaheadDetector(correlation_threshold=0.7)
@@ -129,12 +167,11 @@ class TestPriceFeatures:
         # Should pass (correlation with future should be low)
         assert results['return_5min_lag']['status'] in ['PASS', 'WARNING']
     
-    def test_target_returns_have_lookahead(self):
+    def test_target_returns_have_lookahead(self, mock_ohlcv_1000, price_features):
         """Test that target returns correctly identified as having lookahead."""
-        df = create_mock_ohlcv(1000)
-        features = PriceFeatures(validate_lookahead=False)
+        df = mock_ohlcv_1000
         
-        df, cols = features.compute_returns(df, horizons=[5])
+        df, cols = price_features.compute_returns(df, horizons=[5])
         
         # Target returns SHOULD have lookahead (they use future data)
         detector = LookaheadDetector(correlation_threshold=0.7)
@@ -147,12 +184,9 @@ class TestPriceFeatures:
 class TestTechnicalIndicators:
     """Tests for TechnicalIndicators class."""
     
-    def test_rsi_bounds(self):
+    def test_rsi_bounds(self, df_with_all_indicators):
         """Test RSI stays within [0, 100]."""
-        df = create_mock_ohlcv(200)
-        indicators = TechnicalIndicators(validate_lookahead=False)
-        
-        df = indicators.add_rsi(df, window=14)
+        df = df_with_all_indicators
         
         # RSI should be between 0 and 100
         rsi_values = df['rsi'].dropna()
@@ -162,12 +196,9 @@ class TestTechnicalIndicators:
         # Should have some variation
         assert rsi_values.std() > 1
     
-    def test_macd_calculation(self):
+    def test_macd_calculation(self, df_with_all_indicators):
         """Test MACD calculation."""
-        df = create_mock_ohlcv(200)
-        indicators = TechnicalIndicators(validate_lookahead=False)
-        
-        df = indicators.add_macd(df, fast=12, slow=26, signal=9)
+        df = df_with_all_indicators
         
         # Check columns created
         assert 'macd' in df.columns
@@ -178,12 +209,9 @@ class TestTechnicalIndicators:
         macd_check = df['macd'] - df['macd_signal']
         assert np.allclose(df['macd_hist'], macd_check, equal_nan=True)
     
-    def test_bollinger_bands(self):
+    def test_bollinger_bands(self, df_with_all_indicators):
         """Test Bollinger Bands calculation."""
-        df = create_mock_ohlcv(200)
-        indicators = TechnicalIndicators(validate_lookahead=False)
-        
-        df = indicators.add_bollinger_bands(df, window=20, std=2)
+        df = df_with_all_indicators
         
         # Check columns created
         assert 'bb_upper' in df.columns
@@ -202,13 +230,9 @@ class TestTechnicalIndicators:
         assert (positions >= 0).all()
         assert (positions <= 1).all()
     
-    def test_indicators_no_lookahead(self):
+    def test_indicators_no_lookahead(self, df_with_all_indicators):
         """Test that indicators don't have lookahead bias."""
-        df = create_mock_ohlcv(1000)
-        indicators = TechnicalIndicators(validate_lookahead=False)
-        
-        df = indicators.add_rsi(df)
-        df = indicators.add_macd(df)
+        df = df_with_all_indicators
         
         # Check for lookahead bias
         detector = LookaheadDetector(correlation_threshold=0.7)
@@ -223,9 +247,9 @@ class TestTechnicalIndicators:
 class TestLookaheadDetector:
     """Tests for LookaheadDetector class."""
     
-    def test_detect_obvious_lookahead(self):
+    def test_detect_obvious_lookahead(self, mock_ohlcv_1000):
         """Test detection of obvious lookahead bias."""
-        df = create_mock_ohlcv(1000)
+        df = mock_ohlcv_1000.copy()
         
         # Create a feature with obvious lookahead bias
         df['bad_feature'] = df['close'].shift(-5)  # DIRECTLY USES FUTURE
@@ -237,9 +261,9 @@ class TestLookaheadDetector:
         assert results['bad_feature']['status'] == 'FAIL'
         assert abs(results['bad_feature']['max_correlation']) > 0.9
     
-    def test_detect_no_lookahead(self):
+    def test_detect_no_lookahead(self, mock_ohlcv_1000):
         """Test that legitimate features pass."""
-        df = create_mock_ohlcv(1000)
+        df = mock_ohlcv_1000.copy()
         
         # Create a safe feature (uses past data only)
         df['safe_feature'] = df['close'].rolling(20).mean()
@@ -249,10 +273,22 @@ class TestLookaheadDetector:
         
         # Should pass
         assert results['safe_feature']['status'] in ['PASS', 'WARNING']
-    
-    def test_verify_no_lookahead_raises(self):
+
+    def test_correlations_match_pandas(self, df_with_all_indicators):
+        """Test shared future-return vectors give the same correlations as pandas."""
+        df = df_with_all_indicators
+
+        detector = LookaheadDetector(forward_periods=3)
+        results = detector.detect_lookahead(df, ['rsi', 'macd'])
+
+        for col in ['rsi', 'macd']:
+            for period, corr in results[col]['all_correlations'].items():
+                future_return = df['close'].pct_change(period).shift(-period)
+                assert corr == pytest.approx(df[col].corr(future_return), rel=1e-9)
+
+    def test_verify_no_lookahead_raises(self, mock_ohlcv_1000):
         """Test that verify_no_lookahead raises on failure."""
-        df = create_mock_ohlcv(1000)
+        df = mock_ohlcv_1000.copy()
         df['bad_feature'] = df['close'].shift(-5)
         
         detector = LookaheadDetector(correlation_threshold=0.7)
@@ -261,9 +297,9 @@ class TestLookaheadDetector:
         with pytest.raises(ValueError, match="Lookahead bias detected"):
             detector.verify_no_lookahead(df, ['bad_feature'], raise_on_fail=True)
     
-    def test_verify_no_lookahead_no_raise(self):
+    def test_verify_no_lookahead_no_raise(self, mock_ohlcv_1000):
         """Test that verify_no_lookahead doesn't raise when configured."""
-        df = create_mock_ohlcv(1000)
+        df = mock_ohlcv_1000.copy()
         df['bad_feature'] = df['close'].shift(-5)
         
         detector = LookaheadDetector(correlation_threshold=0.7)
@@ -272,9 +308,9 @@ class TestLookaheadDetector:
         result = detector.verify_no_lookahead(df, ['bad_feature'], raise_on_fail=False)
         assert result is False
     
-    def test_generate_report(self):
+    def test_generate_report(self, mock_ohlcv_1000):
         """Test report generation."""
-        df = create_mock_ohlcv(1000)
+        df = mock_ohlcv_1000.copy()
         df['good_feature'] = df['close'].rolling(20).mean()
         df['bad_feature'] = df['close'].shift(-5)
         
@@ -292,32 +328,39 @@ class TestLookaheadDetector:
 class TestFeatureIntegration:
     """Integration tests for complete feature pipeline."""
     
-    def test_full_feature_pipeline(self):
+    def test_full_feature_pipeline(self, mock_ohlcv_500, price_features, technical_indicators):
         """Test computing all features together."""
-        df = create_mock_ohlcv(500)
+        df = mock_ohlcv_500
         
         # Compute price features
-        price_features = PriceFeatures(validate_lookahead=False)
         df = price_features.compute(df)
         
         # Compute technical indicators
-        indicators = TechnicalIndicators(validate_lookahead=False)
-        df = indicators.compute(df)
+        df = technical_indicators.compute(df)
         
         # Should have many feature columns
-        feature_cols = [c for c in df.columns if c not in 
-                       ['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        feature_cols = feature_columns(df)
         assert len(feature_cols) > 20
         
         # No column should be all NaN
         for col in feature_cols:
             assert df[col].notna().sum() > 0
-    
-    def test_feature_health_check(self):
+
+    @pytest.mark.performance
+    def test_numba_engine_matches_default(self, mock_ohlcv_500, price_features, technical_indicators):
+        """Test the numba window engine reproduces the default feature values."""
+        pytest.importorskip('numba')
+        expected = technical_indicators.compute(price_features.compute(mock_ohlcv_500))
+
+        df = PriceFeatures(validate_lookahead=False, engine='numba').compute(mock_ohlcv_500)
+        df = TechnicalIndicators(validate_lookahead=False, engine='numba').compute(df)
+
+        pd.testing.assert_frame_equal(df, expected, rtol=1e-9)
+
+    def test_feature_health_check(self, mock_ohlcv_200, price_features):
         """Test feature health monitoring."""
-        df = create_mock_ohlcv(200)
+        df = mock_ohlcv_200
         
-        price_features = PriceFeatures(validate_lookahead=False)
         df = price_features.compute(df)
         
         # Check health metrics
@@ -5,6 +5,8 @@ Tests complete trading workflow with all components integrated.
 """
 
 
+import os
+import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -14,39 +16,69 @@ from src.config import load_config
 from src.utils.logger import setup_logging, get_logger
 from src.features.price_features import PriceFeatures
 from src.features.technical_indicators import TechnicalIndicators
+from src.features.base_feature import feature_columns
 from src.strategies.mean_reversion import MeanReversionStrategy
 from src.strategies.position_sizer import PositionSizer
 from src.risk.limits import RiskLimits, Position
 from src.backtest.engine import Backtester
 from src.backtest.performance import PerformanceMetrics
 from src.backtest.attribution import AttributionAnalyzer, Trade
+from src.utils._njit import njit, prange
 
 
-def create_realistic_market_data(days=30):
+@njit(parallel=True, fastmath=True, cache=True)
+def _fix_ohlc(open_, high, low, close):
+    """Widen high/low in place so each bar brackets its open and close."""
+    for i in prange(open_.shape[0]):
+        hi = open_[i] if open_[i] > high[i] else high[i]
+        if close[i] > hi:
+            hi = close[i]
+        lo = open_[i] if open_[i] < low[i] else low[i]
+        if close[i] < lo:
+            lo = close[i]
+        high[i] = hi
+        low[i] = lo
+
+
+def create_realistic_market_data(days=30, rng=None):
     """Create realistic market data with trends and volatility."""
-    np.random.seed(42)
+    if rng is None:
+        rng = np.random.default_rng(42)
     
     timestamps = pd.date_range(start='2024-01-01', periods=days*24*60, freq='1min')
+    n = len(timestamps)
     
     # Generate price with trend + random walk
-    returns = np.random.normal(0.0001, 0.002, len(timestamps))
+    returns = rng.standard_normal(n)
+    returns *= 0.002
+    returns += 0.0001
     price = 50000 * np.exp(np.cumsum(returns))
     
     # Add intraday volatility
-    price += np.random.normal(0, 50, len(timestamps))
+    price += rng.normal(0, 50, n)
+    
+    # Half-normal high/low offsets, folded in place
+    spread = rng.standard_normal((2, n))
+    spread *= 0.002
+    np.abs(spread, out=spread)
+    volume = rng.normal(1000, 200, n)
+    np.abs(volume, out=volume)
+    
+    open_ = price * (1 + rng.normal(0, 0.001, n))
+    high = price * (1 + spread[0])
+    low = price * (1 - spread[1])
+    
+    # Ensure OHLC invariants in one fused pass
+    _fix_ohlc(open_, high, low, price)
     
     df = pd.DataFrame({
         'timestamp': timestamps,
-        'open': price * (1 + np.random.normal(0, 0.001, len(price))),
-        'high': price * (1 + abs(np.random.normal(0, 0.002, len(price)))),
-        'low': price * (1 - abs(np.random.normal(0, 0.002, len(price)))),
+        'open': open_,
+        'high': high,
+        'low': low,
         'close': price,
-        'volume': abs(np.random.normal(1000, 200, len(price)))
-    })
-    
-    # Ensure OHLC invariants
-    df['high'] = df[['open', 'high', 'close']].max(axis=1)
-    df['low'] = df[['open', 'low', 'close']].min(axis=1)
+        'volume': volume
+    }, copy=False)
     
     return df
 
@@ -66,7 +98,13 @@ def test_full_system_integration():
     8. Run backtest
     9. Calculate performance metrics
     10. Analyze attribution
+    
+    Uses TRADEBOT_TEST_DAYS days of 1-minute bars (default 1). Set
+    TRADEBOT_FEATURE_ENGINE=numba to JIT the rolling/ewm feature windows.
     """
+    days = int(os.environ.get('TRADEBOT_TEST_DAYS', '1'))
+    engine = os.environ.get('TRADEBOT_FEATURE_ENGINE') or None
+    
     print("\n" + "="*70)
     print("FULL SYSTEM INTEGRATION TEST")
     print("="*70)
@@ -90,16 +128,16 @@ def test_full_system_integration():
     
     # 3. Create market data
     print("\n3. Generating market data...")
-    df = create_realistic_market_data(days=30)
+    df = create_realistic_market_data(days=days)
     print(f"   Generated {len(df):,} bars ({df['timestamp'].min()} to {df['timestamp'].max()})")
     print(f"   Price range: ${df['close'].min():.2f} - ${df['close'].max():.2f}")
     
     # 4. Engineer features
     print("\n4. Engineering features...")
-    price_features = PriceFeatures(validate_lookahead=False)
+    price_features = PriceFeatures(validate_lookahead=False, engine=engine)
     df = price_features.compute(df)
     
-    indicators = TechnicalIndicators(validate_lookahead=False)
+    indicators = TechnicalIndicators(validate_lookahead=False, engine=engine)
     df = indicators.add_rsi(df, window=config.strategy.mean_reversion.rsi_window)
     df = indicators.add_bollinger_bands(
         df, 
@@ -107,7 +145,7 @@ def test_full_system_integration():
         std=config.strategy.mean_reversion.bollinger_std
     )
     
-    print(f"   Added {len([c for c in df.columns if c not in ['timestamp', 'open', 'high', 'low', 'close', 'volume']])} features")
+    print(f"   Added {len(feature_columns(df))} features")
     
     # 5. Generate trading signals
     print("\n5. Generating trading signals...")
@@ -198,17 +236,21 @@ def test_full_system_integration():
         print("   (Note: Full integration with backtest trade log would be in production)")
         
         # For demo, create sample trades
+        # DatetimeArray indexing yields Timestamps; close is a plain float64 array
+        timestamps = df['timestamp'].array
+        close = df['close'].to_numpy()
         for i in range(min(5, metrics['total_trades'])):
+            entry, exit_ = i * 100, i * 100 + 50
             trade = Trade(
-                timestamp=df['timestamp'].iloc[i * 100],
+                timestamp=timestamps[entry],
                 symbol='BTC/USD',
                 side='BUY' if i % 2 == 0 else 'SELL',
                 quantity=0.1,
-                entry_price=df['close'].iloc[i * 100],
-                exit_price=df['close'].iloc[i * 100 + 50],
-                exit_timestamp=df['timestamp'].iloc[i * 100 + 50],
-                commission=config.backtest.commission_pct * 0.1 * df['close'].iloc[i * 100],
-                slippage=config.backtest.slippage_pct * 0.1 * df['close'].iloc[i * 100]
+                entry_price=close[entry],
+                exit_price=close[exit_],
+                exit_timestamp=timestamps[exit_],
+                commission=config.backtest.commission_pct * 0.1 * close[entry],
+                slippage=config.backtest.slippage_pct * 0.1 * close[entry]
             )
             analyzer.add_trade(trade)
         
@@ -234,6 +276,13 @@ def test_full_system_integration():
     return True
 
 
+@pytest.mark.performance
+def test_full_system_integration_30_days(monkeypatch):
+    """Run the full integration flow on 30 days of 1-minute bars."""
+    monkeypatch.setenv('TRADEBOT_TEST_DAYS', '30')
+    assert test_full_system_integration()
+
+
 if __name__ == '__main__':
     try:
         test_full_system_integration()
@@ -5,7 +5,6 @@ Simple test to verify feature module works
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 
 from src.features.price_features import PriceFeatures
 from src.features.technical_indicators import TechnicalIndicators
@@ -14,22 +13,18 @@ from src.features.validation.lookahead_detector import LookaheadDetector
 
 def create_mock_data(n=100):
     """Create simple mock OHLCV data."""
-    np.random.seed(42)
-    timestamps = [datetime(2024, 1, 1) + timedelta(minutes=i) for i in range(n)]
-    prices = 100 * np.cumprod(1 + np.random.normal(0, 0.01, n))
+    rng = np.random.default_rng(42)
+    timestamps = pd.date_range('2024-01-01', periods=n, freq='min')
+    prices = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
     
-    data = []
-    for i, (ts, close) in enumerate(zip(timestamps, prices)):
-        data.append({
-            'timestamp': ts,
-            'open': close * 0.99,
-            'high': close * 1.01,
-            'low': close * 0.98,
-            'close': close,
-            'volume': 1000000
-        })
-    
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': prices * 0.99,
+        'high': prices * 1.01,
+        'low': prices * 0.98,
+        'close': prices,
+        'volume': np.full(n, 1000000, dtype=np.int64)
+    })
 
 print("Creating mock data...")
 df = create_mock_data(200)
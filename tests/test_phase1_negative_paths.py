@@ -36,6 +36,21 @@ def test_validator_dedupes_duplicate_burst_and_reports():
     assert report['duplicates_removed'] == 2
 
 
+def test_compiled_validator_reports_like_generic():
+    validator = DataValidator(fail_on_error=False)
+    df = pd.DataFrame({
+        'timestamp': pd.date_range(end=pd.Timestamp.now(tz='UTC'), periods=2, freq='min'),
+        'open': [1.0, 1.0], 'high': [2.0, 0.4], 'low': [0.5, 0.5], 'close': [1.0, 1.0], 'volume': [10, 10],
+    })
+    validate = validator.compile_for(df.dtypes.to_dict())
+
+    assert validate(df) is False
+    assert validator.get_last_report()['range_errors'] == 2
+    assert validate(df.assign(high=2.0)) is True
+    # Unsupported dtypes skip specialization entirely
+    assert validator.compile_for({**df.dtypes.to_dict(), 'close': 'object'}) == validator.validate
+
+
 def test_risk_config_boundaries_new_fields():
     with pytest.raises(Exception):
         RiskLimitsConfig(max_symbol_exposure=1.5)
@@ -1,12 +1,14 @@
 
 """Phase 1 optimization regression tests."""
 
+import copy
 import time
 import pytest
 import pandas as pd
 import numpy as np
 
 from src.backtest.engine import Backtester
+from src.backtest.execution import ExecutionModel
 from src.backtest.walk_forward import WalkForwardValidator
 from src.strategies.mean_reversion import MeanReversionStrategy
 from src.strategies.position_sizer import PositionSizer
@@ -18,28 +20,49 @@ class _StaticStrategy:
         self.signals = signals
 
     def generate_signals(self, df):
-        out = df.copy()
-        if len(self.signals) == len(out):
-            out['signal'] = self.signals
-        else:
-            out['signal'] = [0] * len(out)
-        return out
+        # assign() shares the existing columns; only 'signal' is materialized
+        if len(self.signals) == len(df):
+            return df.assign(signal=self.signals)
+        return df.assign(signal=0)
 
 
-def _price_frame(n=200):
+def _price_frame(n=200, seed=42):
+    rng = np.random.default_rng(seed)
     ts = pd.date_range('2024-01-01', periods=n, freq='min')
-    close = 100 + np.cumsum(np.random.normal(0, 0.2, n))
+    close = 100 + np.cumsum(rng.normal(0, 0.2, n))
     df = pd.DataFrame({
         'timestamp': ts,
         'open': close,
         'high': close * 1.001,
         'low': close * 0.999,
         'close': close,
-        'volume': np.random.uniform(1000, 2000, n),
+        'volume': rng.uniform(1000, 2000, n),
     })
     return df
 
 
+@pytest.fixture(scope='module')
+def price_frame_400():
+    """Shared 400-bar frame; copy before adding columns."""
+    return _price_frame(400)
+
+
+@pytest.fixture(scope='module')
+def price_frame_10k():
+    """Shared 10,000-bar frame; copy before adding columns."""
+    return _price_frame(10_000)
+
+
+@pytest.fixture(scope='module')
+def mean_rev_long_only():
+    """Shared long-only strategy; generate_signals keeps no per-call state."""
+    strategy = MeanReversionStrategy({'long_only': True})
+    state = copy.deepcopy(vars(strategy))
+    yield strategy
+    # Sharing is only safe while no test leaves state behind
+    assert vars(strategy) == state
+
+
 def test_backtester_uses_lagged_position_alignment():
     df = pd.DataFrame({'close': [100, 110, 100, 100]})
     strategy = _StaticStrategy(signals=[0, 1, 1, 0])
@@ -52,8 +75,8 @@ def test_backtester_uses_lagged_position_alignment():
     assert results.loc[2, 'strategy_return'] != 0
 
 
-def test_mean_reversion_long_only_and_exits_to_flat():
-    df = _price_frame(120)
+def test_mean_reversion_long_only_and_exits_to_flat(price_frame_400):
+    df = price_frame_400.iloc[:120]
     strategy = MeanReversionStrategy({'long_only': True, 'stop_loss_pct': 0.02, 'max_bars_in_trade': 5})
     out = strategy.generate_signals(df)
 
@@ -90,9 +113,9 @@ def test_risk_concentration_and_correlation_limits():
 
 
 
-def test_walk_forward_runs_multiple_folds():
-    df = _price_frame(400)
-    strategy = MeanReversionStrategy({'long_only': True})
+def test_walk_forward_runs_multiple_folds(price_frame_400, mean_rev_long_only):
+    df = price_frame_400
+    strategy = mean_rev_long_only
     backtester = Backtester()
     wf = WalkForwardValidator(backtester, train_size=120, test_size=60)
 
@@ -101,11 +124,24 @@ def test_walk_forward_runs_multiple_folds():
     assert not summary.empty
 
 
+def test_walk_forward_parallel_matches_sequential(price_frame_400, mean_rev_long_only):
+    strategy = mean_rev_long_only
+    sequential = WalkForwardValidator(Backtester(), train_size=120, test_size=60)
+    parallel = WalkForwardValidator(Backtester(), train_size=120, test_size=60, n_jobs=2)
+
+    _, expected = sequential.run(strategy, price_frame_400)
+    _, summary = parallel.run(strategy, price_frame_400)
+
+    pd.testing.assert_frame_equal(
+        summary.drop(columns='runtime_seconds'),
+        expected.drop(columns='runtime_seconds'),
+    )
+
+
 @pytest.mark.performance
-def test_backtest_performance_budget_10k_under_2s():
-    np.random.seed(42)
-    df = _price_frame(10000)
-    strategy = MeanReversionStrategy({'long_only': True})
+def test_backtest_performance_budget_10k_under_2s(price_frame_10k, mean_rev_long_only):
+    df = price_frame_10k
+    strategy = mean_rev_long_only
     backtester = Backtester()
 
     start = time.perf_counter()
@@ -115,25 +151,46 @@ def test_backtest_performance_budget_10k_under_2s():
     assert elapsed < 2.0
 
 
-def test_execution_model_partial_fill_limit_orders():
-    df = _price_frame(80)
+def test_execution_model_partial_fill_limit_orders(price_frame_400, mean_rev_long_only):
+    df = price_frame_400.iloc[:80]
 
-    strategy = MeanReversionStrategy({'long_only': True})
+    strategy = mean_rev_long_only
     backtester = Backtester()
 
+    order_type = pd.CategoricalDtype(['market', 'limit'])
+
     market_df = df.copy()
-    market_df['order_type'] = 'market'
+    market_df['order_type'] = pd.Categorical(['market'] * len(df), dtype=order_type)
     market_df['book_depth'] = 1.0
     m_results, _ = backtester.run(strategy, market_df)
 
     limit_df = df.copy()
-    limit_df['order_type'] = 'limit'
+    limit_df['order_type'] = pd.Categorical(['limit'] * len(df), dtype=order_type)
     limit_df['book_depth'] = 0.001
     l_results, _ = backtester.run(strategy, limit_df)
 
     assert l_results['position_change'].sum() <= m_results['position_change'].sum()
 
 
+def test_execution_model_compiled_path_matches_simulate_fill():
+    class _PerBarModel(ExecutionModel):
+        def simulate_fill(self, *args, **kwargs):
+            return super().simulate_fill(*args, **kwargs)
+
+    rng = np.random.default_rng(7)
+    n = 500
+    target = np.round(rng.normal(0, 0.01, n), 3)
+    order_types = np.where(rng.random(n) < 0.5, 'market', 'limit').astype(object)
+    book_depth = rng.uniform(0, 0.02, n)
+    volatility = rng.uniform(0, 0.05, n)
+
+    compiled = ExecutionModel().simulate_path(target, order_types, book_depth, volatility)
+    per_bar = _PerBarModel().simulate_path(target, order_types, book_depth, volatility)
+
+    np.testing.assert_allclose(compiled[0], per_bar[0], rtol=1e-12)
+    np.testing.assert_array_equal(compiled[1], per_bar[1])
+
+
 def test_sector_cluster_exposure_limits():
     risk = RiskLimits({
         'max_position_size': 0.50,
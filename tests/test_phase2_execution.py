@@ -1,10 +1,12 @@
 """Phase 2 paper-trading layer tests."""
 
+import pytest
+
 from src.execution import (
     OrderManager, PaperOrder, OrderState, RejectReason,
     SimulatedExchange, PositionTracker, ReconciliationEngine,
 )
-from src.risk.limits import RiskLimits, Position
+from src.risk.limits import RiskLimits, RiskState, Position, Order
 
 
 def test_order_lifecycle_all_states_covered():
@@ -33,6 +35,24 @@ def test_order_lifecycle_all_states_covered():
     assert o3.reject_reason == RejectReason.INVALID_ORDER.value
 
 
+def test_order_lifecycle_rejects_illegal_transitions():
+    manager = OrderManager()
+
+    filled = manager.submit_order(PaperOrder(symbol='BTC/USD', side='buy', quantity=1))
+    manager.apply_fill(filled.id, fill_qty=1, fill_price=100)
+    with pytest.raises(ValueError):
+        manager.cancel_order(filled.id)
+
+    canceled = manager.cancel_order(manager.submit_order(PaperOrder(symbol='ETH/USD', side='buy', quantity=2)).id)
+    with pytest.raises(ValueError):
+        manager.apply_fill(canceled.id, fill_qty=1, fill_price=100)
+    assert canceled.status == OrderState.CANCELED
+    assert canceled.filled_quantity == 0
+
+    telemetry = manager.get_telemetry()['state_counts']
+    assert telemetry['filled'] == 1 and telemetry['canceled'] == 1
+
+
 def test_kill_switch_and_circuit_breaker_rejections():
     manager = OrderManager(max_daily_loss_abs=100)
     manager.set_kill_switch(True)
@@ -57,6 +77,47 @@ def test_exposure_precheck_before_submission():
     assert out.reject_reason == RejectReason.RISK_CHECK_FAILED.value
 
 
+def test_tracker_fed_risk_state_matches_position_scan():
+    risk = RiskLimits({
+        'max_position_size': 0.50,
+        'max_symbol_exposure': 0.50,
+        'max_sector_exposure': 0.20,
+        'max_portfolio_heat': 0.50,
+    })
+    tracker = PositionTracker(risk_state=risk.state)
+    tracker.apply_fill('A', 'buy', 20, 100, sector='tech')
+    tracker.apply_fill('A', 'sell', 5, 100)
+    tracker.apply_fill('C', 'sell', 3, 50, sector='energy')
+
+    assert risk.state.symbol_notional == {'A': 1500, 'C': 150}
+    assert risk.state.sector_notional == {'tech': 1500, 'energy': 150}
+
+    open_positions = [
+        Position(symbol='A', quantity=15, entry_price=100, current_price=100, sector='tech'),
+        Position(symbol='C', quantity=-3, entry_price=50, current_price=50, sector='energy'),
+    ]
+    for order in (Order(symbol='B', quantity=10, price=100, sector='tech'),
+                  Order(symbol='B', quantity=4, price=100, sector='tech')):
+        assert risk.check_order(order, 10_000) == risk.check_order(order, 10_000, open_positions)
+
+    tracker.apply_fill('A', 'sell', 15, 100)
+    assert 'A' not in risk.state.symbol_notional
+    assert risk.state.sector_notional['tech'] == 0
+
+
+def test_risk_state_moves_full_notional_when_tagged_late():
+    state = RiskState()
+    state.update_on_fill('A', 10, 100)
+    state.update_on_fill('A', 5, 100, sector='tech', cluster='c1')
+
+    assert state.sector_notional == {'tech': 1500}
+    assert state.cluster_notional == {'c1': 1500}
+
+    state.update_on_fill('A', -5, 100, sector='fin')
+    assert state.sector_notional == {'tech': 0, 'fin': 1000}
+    assert state.cluster_notional == {'c1': 1000}
+
+
 def test_simulated_exchange_depth_aware_partial_fill():
     ex = SimulatedExchange(seed=1)
     limit = PaperOrder(symbol='BTC/USD', side='buy', quantity=10, order_type='limit', limit_price=100)
@@ -70,6 +131,25 @@ def test_simulated_exchange_depth_aware_partial_fill():
     assert 'latency_histogram' in metrics
 
 
+def test_simulated_exchange_batch_matches_sequential_execute():
+    orders = [
+        PaperOrder(symbol='BTC/USD', side='buy', quantity=2, order_type='market'),
+        PaperOrder(symbol='BTC/USD', side='buy', quantity=10, order_type='limit', limit_price=100),
+        PaperOrder(symbol='BTC/USD', side='sell', quantity=10, order_type='limit', limit_price=100),
+        PaperOrder(symbol='BTC/USD', side='sell', quantity=3, order_type='limit', limit_price=98),
+        PaperOrder(symbol='BTC/USD', side='sell', quantity=1, order_type='limit'),
+    ]
+    prices, depths, vols = [101, 99, 99, 99, 99], [1, 4, 4, 50, 1], [0.004, 0.01, 0.01, 0.3, 0.0]
+
+    sequential = SimulatedExchange(seed=3)
+    expected = [sequential.execute(*args) for args in zip(orders, prices, depths, vols)]
+    batch = SimulatedExchange(seed=3)
+
+    assert batch.execute_batch(orders, prices, depths, vols) == expected
+    assert batch.get_metrics()['fill_events'] == len(orders)
+    assert sum(batch.get_metrics()['latency_histogram'].values()) == len(orders)
+
+
 def test_position_tracker_realized_and_unrealized_pnl():
     tracker = PositionTracker()
     tracker.apply_fill('BTC/USD', 'buy', 2, 100)
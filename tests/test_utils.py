@@ -5,11 +5,26 @@ Tests for retry logic, rate limiter, and logger.
 """
 
 
+import json
+import logging
+import math
+import os
+import sys
 import pytest
+import threading
 import time
-from src.utils.retry import retry_with_backoff, RetryContext
+import types
+from src.utils import rate_limiter
+from src.utils.retry import retry_with_backoff, retry_if, Retry, RetryContext, _backoff_schedule, _backoff_seconds
 from src.utils.rate_limiter import RateLimiter
-from src.utils.exceptions import DataIngestionError
+from src.utils.exceptions import DataIngestionError, RetryExhaustedError
+from src.utils.logger import (
+    AppendRotatingFileHandler,
+    BatchingLogWriter,
+    JSONFormatter,
+    _LEVEL_MAP,
+    compile_json_formatter,
+)
 
 
 class TestRetry:
@@ -64,6 +79,56 @@ class TestRetry:
         with pytest.raises(ValueError):
             raises_wrong_exception()
 
+    def test_retry_if_sentinel(self):
+        """Test Retry results are retried without raising."""
+        attempts = [0]
+        
+        @retry_if(max_attempts=3, base_delay=0.01)
+        def rate_limited():
+            attempts[0] += 1
+            if attempts[0] < 3:
+                return Retry(delay=0.0)
+            return "Success"
+        
+        assert rate_limited() == "Success"
+        assert attempts[0] == 3
+    
+    def test_retry_if_predicate_exhausted(self):
+        """Test predicate-flagged results raise once attempts run out."""
+        attempts = [0]
+        
+        @retry_if(lambda result: result is None, max_attempts=2, base_delay=0.01)
+        def empty():
+            attempts[0] += 1
+        
+        with pytest.raises(RetryExhaustedError):
+            empty()
+        assert attempts[0] == 2
+
+    def test_backoff_schedule_capped(self):
+        """Test precomputed delays double and respect max_delay."""
+        delays, jitters = _backoff_schedule(max_attempts=5, base_delay=1.0, max_delay=5.0)
+        
+        assert delays == (1_000_000_000, 2_000_000_000, 4_000_000_000, 5_000_000_000)
+        assert jitters == (100_000_000, 200_000_000, 400_000_000, 500_000_000)
+        assert 1.0 <= _backoff_seconds(delays[0], jitters[0]) < 1.1
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Monotonic clock for the rate limiter that only moves when a test moves it."""
+    clock = [0]
+    monkeypatch.setattr(rate_limiter, 'time', types.SimpleNamespace(monotonic_ns=lambda: clock[0]))
+    return clock
+
+
+def _wait_until(condition, timeout=5.0):
+    """Poll for a cross-thread condition; fails the test rather than hanging."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
 
 class TestRateLimiter:
     """Test rate limiter."""
@@ -93,6 +158,23 @@ class TestRateLimiter:
         # Should wait approximately 1 second
         assert 0.9 < elapsed < 1.5
     
+    def test_blocked_acquire_waits_once(self, fake_clock):
+        """Test a blocked caller sleeps the exact deficit once instead of polling."""
+        limiter = RateLimiter(calls_per_minute=1200, burst_size=1)  # 1 token / 0.05s
+        waits = []
+        
+        def wait(timeout):
+            # Stand-in for sleeping: the clock jumps by exactly the timeout
+            waits.append(timeout)
+            fake_clock[0] += math.ceil(timeout * 1e9)
+        limiter._cv.wait = wait
+        
+        for _ in range(5):
+            limiter.acquire()
+        
+        # Burst token first, then one timed wait per refill
+        assert waits == [pytest.approx(0.05)] * 4
+    
     def test_non_blocking_acquire(self):
         """Test non-blocking acquire returns False when no tokens."""
         limiter = RateLimiter(calls_per_minute=60, burst_size=1)
@@ -103,6 +185,78 @@ class TestRateLimiter:
         # Second call fails (no tokens)
         assert limiter.acquire(blocking=False) == False
     
+    def test_concurrent_waiters_share_refills(self):
+        """Test blocked threads are released one token at a time."""
+        limiter = RateLimiter(calls_per_minute=600, burst_size=1)  # 1 token / 0.1s
+        
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        elapsed = time.monotonic() - start
+        
+        # First call uses the burst token, the other four wait for refills
+        assert not any(thread.is_alive() for thread in threads)
+        assert 0.35 < elapsed < 1.0
+    
+    def test_queued_waiters_granted_in_fifo_order(self, fake_clock):
+        """Test each refill goes to the longest-queued waiter, never a newcomer."""
+        limiter = RateLimiter(calls_per_minute=1, burst_size=1)  # 1 token / 60s
+        limiter.acquire()
+        granted = []
+        
+        def take(i):
+            limiter.acquire()
+            granted.append(i)
+        
+        # Queue waiters one at a time so their queue order is known
+        threads = []
+        for i in range(4):
+            threads.append(threading.Thread(target=take, args=(i,), daemon=True))
+            threads[-1].start()
+            _wait_until(lambda: len(limiter._waiters) == i + 1)
+        
+        for i in range(4):
+            with limiter._cv:
+                fake_clock[0] += 60 * 1_000_000_000  # one token
+            # The refilled token is reserved for the head of the queue
+            assert limiter.try_acquire() is False
+            with limiter._cv:
+                limiter._cv.notify_all()
+            _wait_until(lambda: len(granted) == i + 1)
+            assert granted == list(range(i + 1))
+        
+        for thread in threads:
+            thread.join(timeout=5)
+        assert not any(thread.is_alive() for thread in threads)
+        assert not limiter._waiters
+    
+    def test_try_acquire(self):
+        """Test non-blocking fast path takes tokens until the bucket is empty."""
+        limiter = RateLimiter(calls_per_minute=60, burst_size=2)
+        
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is False
+    
+    def test_acquire_batch(self):
+        """Test a batch of tokens is taken, waited for, and validated at once."""
+        limiter = RateLimiter(calls_per_minute=600, burst_size=5)  # 1 token / 0.1s
+        
+        assert limiter.acquire(tokens=4) is True
+        assert limiter.try_acquire(tokens=2) is False
+        
+        start = time.monotonic()
+        limiter.acquire(tokens=3)  # 1 left, waits for 2 more
+        elapsed = time.monotonic() - start
+        
+        assert 0.15 < elapsed < 0.5
+        assert limiter.get_stats()['current_rate'] == 7
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=6)
+    
     def test_reset(self):
         """Test reset refills tokens."""
         limiter = RateLimiter(calls_per_minute=60, burst_size=2)
@@ -119,6 +273,22 @@ class TestRateLimiter:
         # Should have tokens again
         assert limiter.acquire(blocking=False) == True
     
+    def test_reset_wakes_blocked_acquire(self):
+        """Test reset releases a caller blocked on an empty bucket."""
+        limiter = RateLimiter(calls_per_minute=1, burst_size=1)
+        limiter.acquire()
+        
+        # Without a reset this would block for ~60 seconds
+        waiter = threading.Thread(target=limiter.acquire)
+        start = time.monotonic()
+        waiter.start()
+        time.sleep(0.05)
+        limiter.reset()
+        waiter.join(timeout=5)
+        
+        assert not waiter.is_alive()
+        assert time.monotonic() - start < 1.0
+    
     def test_stats(self):
         """Test statistics tracking."""
         limiter = RateLimiter(calls_per_minute=60, burst_size=5)
@@ -129,6 +299,136 @@ class TestRateLimiter:
         stats = limiter.get_stats()
         assert stats['calls_per_minute_limit'] == 60
         assert stats['current_rate'] == 3
+        assert stats['capacity'] == 5
+        assert stats['refill_rate'] == 1.0
+    
+    def test_rate_per_period_with_initial_tokens(self):
+        """Test sustained rate, capacity and starting tokens are independent."""
+        limiter = RateLimiter(rate_per_period=10, period=1.0, burst=3, initial_tokens=1)
+        
+        assert limiter.refill_rate == 10.0
+        assert limiter.calls_per_minute == 600.0
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is False
+        
+        with pytest.raises(ValueError):
+            RateLimiter(calls_per_minute=60, rate_per_period=1)
+
+
+class TestLogger:
+    """Test logging formatters."""
+
+    def _record(self, exc_info=None):
+        record = logging.LogRecord(
+            'tests', logging.ERROR, __file__, 10, 'value=%s', (42,), exc_info
+        )
+        record.extra = {'symbol': 'BTC/USD'}
+        return record
+
+    def test_compiled_json_formatter_matches_generic(self):
+        """Test compiled formatter emits the same JSON as JSONFormatter."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = self._record(exc_info=sys.exc_info())
+
+        generic = json.loads(JSONFormatter().format(record))
+        compiled = json.loads(compile_json_formatter().format(record))
+
+        assert compiled == generic
+        assert compiled['message'] == 'value=42'
+        assert compiled['symbol'] == 'BTC/USD'
+        assert 'ValueError' in compiled['exception']
+
+    def test_exception_text_formatted_once(self, monkeypatch):
+        """Test traceback text is cached on the record across formatters."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = self._record(exc_info=sys.exc_info())
+
+        calls = []
+        original = logging.Formatter.formatException
+        monkeypatch.setattr(
+            logging.Formatter, 'formatException',
+            lambda self, ei: calls.append(1) or original(self, ei)
+        )
+
+        JSONFormatter().format(record)
+        compile_json_formatter().format(record)
+
+        assert len(calls) == 1
+
+    def test_compiled_json_formatter_opt_out(self):
+        """Test disabled exception/extra handling is omitted."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = self._record(exc_info=sys.exc_info())
+
+        formatter = compile_json_formatter(include_exception=False, include_extra=False)
+        output = json.loads(formatter.format(record))
+
+        assert 'exception' not in output
+        assert 'symbol' not in output
+
+    def test_level_map_accepts_stdlib_names(self):
+        """Test every stdlib level name (incl. WARN/FATAL/NOTSET) is accepted."""
+        for name, level in logging.getLevelNamesMapping().items():
+            assert _LEVEL_MAP[name] == level
+
+    def test_append_handler_rotates(self, tmp_path):
+        """Test append handler writes records and rotates by size."""
+        log_file = tmp_path / 'bot.log'
+        handler = AppendRotatingFileHandler(str(log_file), max_bytes=200, backup_count=2)
+        handler.setFormatter(compile_json_formatter())
+
+        for _ in range(10):
+            handler.emit(self._record())
+        handler.close()
+
+        assert log_file.exists()
+        assert (tmp_path / 'bot.log.1').exists()
+        assert not (tmp_path / 'bot.log.3').exists()
+        for line in log_file.read_text().splitlines():
+            assert json.loads(line)['message'] == 'value=42'
+
+    def test_append_handler_survives_failed_rotation(self, tmp_path, monkeypatch):
+        """Test a rename error during rotation leaves the handler writable."""
+        log_file = tmp_path / 'bot.log'
+        handler = AppendRotatingFileHandler(str(log_file), max_bytes=200, backup_count=2)
+        handler.setFormatter(compile_json_formatter())
+        handler.handleError = lambda record: None
+        handler.emit(self._record())
+
+        def fail_replace(src, dst):
+            raise OSError("rotated elsewhere")
+        monkeypatch.setattr(os, 'replace', fail_replace)
+        for _ in range(5):
+            handler.emit(self._record())
+        monkeypatch.undo()
+        handler.emit(self._record())
+        handler.close()
+
+        assert (tmp_path / 'bot.log.1').exists()
+        assert len(log_file.read_text().splitlines()) == 1
+
+    def test_batching_writer_flushes_on_stop(self, tmp_path):
+        """Test queued records are all written once the writer stops."""
+        log_file = tmp_path / 'bot.log'
+        handler = AppendRotatingFileHandler(str(log_file))
+        handler.setFormatter(compile_json_formatter())
+        writer = BatchingLogWriter(handler, max_batch=4)
+        writer.start()
+
+        queue_handler = writer.queue_handler()
+        for _ in range(10):
+            queue_handler.handle(self._record())
+        writer.stop()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 10
+        assert json.loads(lines[0])['message'] == 'value=42'
 
 
 if __name__ == '__main__':